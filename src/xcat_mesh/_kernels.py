@@ -0,0 +1,169 @@
+"""Numba CPU kernels. Requires the optional ``numba`` dependency; callers guard the import."""
+from __future__ import annotations
+from typing import Tuple
+import numpy as np
+from numba import njit, prange
+
+from . import _mc_lut
+
+_TRI_TABLE = _mc_lut.TRI_TABLE
+_NUM_TRI = _mc_lut.NUM_TRI
+_EDGE_ORIGIN = _mc_lut.EDGE_ORIGIN
+_EDGE_AXIS = _mc_lut.EDGE_AXIS
+
+_cube_index = njit(inline="always")(_mc_lut.cube_index)
+_num_crossings = njit(inline="always")(_mc_lut.num_crossings)
+
+@njit(parallel=True, cache=True)
+def _mc_count(m, vert_count, tri_count):
+    n0, n1, n2 = m.shape
+    for i in prange(n0):
+        for j in range(n1):
+            nv = 0
+            for k in range(n2):
+                nv += _num_crossings(m, i, j, k, 3)
+            vert_count[i, j] = nv
+
+            nt = 0
+            if i + 1 < n0 and j + 1 < n1:
+                for k in range(n2 - 1):
+                    c = _cube_index(m, i, j, k)
+                    # Uniform cells (all 8 corners equal) are the common case
+                    if c == 0 or c == 255:
+                        continue
+                    nt += _NUM_TRI[c]
+            tri_count[i, j] = nt
+
+@njit(parallel=True, cache=True)
+def _mc_emit(m, spacing, vert_count, tri_count, vert_start, tri_start, verts, faces):
+    n0, n1, n2 = m.shape
+    sx, sy, sz = spacing[0], spacing[1], spacing[2]
+    for i in prange(n0):
+        before = np.zeros(4, dtype=np.int64)
+        for j in range(n1):
+            # Vertices live on crossed grid edges, numbered row by row in (k, axis) order.
+            # Level 0.5 on a binary mask always lands on the edge midpoint.
+            if vert_count[i, j] > 0:
+                vid = vert_start[i, j]
+                for k in range(n2):
+                    v = m[i, j, k] != 0
+                    if i + 1 < n0 and (m[i + 1, j, k] != 0) != v:
+                        verts[vid, 0] = (i + 0.5) * sx
+                        verts[vid, 1] = j * sy
+                        verts[vid, 2] = k * sz
+                        vid += 1
+                    if j + 1 < n1 and (m[i, j + 1, k] != 0) != v:
+                        verts[vid, 0] = i * sx
+                        verts[vid, 1] = (j + 0.5) * sy
+                        verts[vid, 2] = k * sz
+                        vid += 1
+                    if k + 1 < n2 and (m[i, j, k + 1] != 0) != v:
+                        verts[vid, 0] = i * sx
+                        verts[vid, 1] = j * sy
+                        verts[vid, 2] = (k + 0.5) * sz
+                        vid += 1
+
+            if i + 1 >= n0 or j + 1 >= n1 or tri_count[i, j] == 0:
+                continue
+
+            # Cells of row (i, j) reference edges on rows (i+dx, j+dy); before[dx + 2*dy]
+            # counts the crossed edges on each of those rows at positions < k
+            before[:] = 0
+            tid = tri_start[i, j]
+            for k in range(n2 - 1):
+                c = _cube_index(m, i, j, k)
+                if c != 0 and c != 255:
+                    for t in range(_NUM_TRI[c]):
+                        for s in range(3):
+                            e = _TRI_TABLE[c, 3 * t + s]
+                            dx = _EDGE_ORIGIN[e, 0]
+                            dy = _EDGE_ORIGIN[e, 1]
+                            dz = _EDGE_ORIGIN[e, 2]
+                            r = dx + 2 * dy
+                            idx = vert_start[i + dx, j + dy] + before[r]
+                            if dz:
+                                idx += _num_crossings(m, i + dx, j + dy, k, 3)
+                            idx += _num_crossings(m, i + dx, j + dy, k + dz, _EDGE_AXIS[e])
+                            faces[tid + t, s] = idx
+                    tid += _NUM_TRI[c]
+                for r in range(4):
+                    before[r] += _num_crossings(m, i + (r & 1), j + (r >> 1), k, 3)
+
+def marching_cubes_numba(mask: np.ndarray, spacing_mm: Tuple[float, float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Parallel marching cubes for binary masks; see mesh.marching_cubes_binary."""
+    n0, n1 = mask.shape[:2]
+    vert_count = np.empty((n0, n1), dtype=np.int64)
+    tri_count = np.empty((n0, n1), dtype=np.int64)
+    _mc_count(mask, vert_count, tri_count)
+
+    # Exclusive prefix sums give every row its own output slice (no atomics needed)
+    vert_start = np.cumsum(vert_count, axis=None).reshape(n0, n1) - vert_count
+    tri_start = np.cumsum(tri_count, axis=None).reshape(n0, n1) - tri_count
+
+    verts = np.empty((int(vert_count.sum()), 3), dtype=np.float32)
+    faces = np.empty((int(tri_count.sum()), 3), dtype=np.int32)
+    _mc_emit(mask, np.asarray(spacing_mm, dtype=np.float64), vert_count, tri_count,
+             vert_start, tri_start, verts, faces)
+    return verts, faces
+
+@njit(parallel=True, cache=True)
+def _prep_mask(data, mask01, has_fg):
+    n0, n1, n2 = data.shape
+    for i in prange(n0):
+        fg = 0
+        for j in range(n1):
+            for k in range(n2):
+                if data[i, j, k] > 0.5:
+                    mask01[i, j, k] = 1
+                    fg = 1
+                else:
+                    mask01[i, j, k] = 0
+        has_fg[i] = fg
+
+def prep_mask(data: np.ndarray) -> Tuple[np.ndarray, bool]:
+    """Binarize a 3D volume at 0.5 and report whether any voxel is foreground, in one pass."""
+    mask01 = np.empty(data.shape, dtype=np.uint8)
+    # One flag per plane, so threads never write to the same slot
+    has_fg = np.zeros(data.shape[0], dtype=np.int8)
+    _prep_mask(data, mask01, has_fg)
+    return mask01, bool(has_fg.any())
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _smooth_step(crow, col, v, out, coef):
+    # out = v + coef * (mean(neighbors) - v), one vertex per iteration
+    for i in prange(v.shape[0]):
+        start = crow[i]
+        end = crow[i + 1]
+        sx = 0.0
+        sy = 0.0
+        sz = 0.0
+        for j in range(start, end):
+            k = col[j]
+            sx += v[k, 0]
+            sy += v[k, 1]
+            sz += v[k, 2]
+        # Isolated vertices have a zero mean, as with the row_sum clamp in smooth.py
+        deg = max(end - start, 1)
+        out[i, 0] = v[i, 0] + coef * (sx / deg - v[i, 0])
+        out[i, 1] = v[i, 1] + coef * (sy / deg - v[i, 1])
+        out[i, 2] = v[i, 2] + coef * (sz / deg - v[i, 2])
+
+def smooth_csr(verts: np.ndarray, crow: np.ndarray, col: np.ndarray, coefs, num_iter: int) -> np.ndarray:
+    """
+    Laplacian/Taubin smoothing over a CSR adjacency; returns new float32 vertices.
+
+    Args:
+        verts: Vertex positions (N, 3)
+        crow, col: CSR row pointers and column indices of the adjacency
+        coefs: Step coefficients applied in order each iteration
+               ((weight,) for Laplacian, (lambda, mu) for Taubin)
+        num_iter: Number of iterations
+    """
+    # One copy into the ping-pong buffer; the caller's vertices are left untouched
+    v = np.array(verts, dtype=np.float32)
+    out = np.empty_like(v)
+    for _ in range(int(num_iter)):
+        for coef in coefs:
+            _smooth_step(crow, col, v, out, float(coef))
+            v, out = out, v
+    return v
@@ -0,0 +1,245 @@
+"""Numba CUDA kernels. Requires ``numba`` with a working CUDA driver; callers guard the import."""
+from __future__ import annotations
+from typing import Tuple
+import math
+import numpy as np
+from numba import cuda, float32
+
+from . import _mc_lut
+
+_TRI_TABLE = _mc_lut.TRI_TABLE
+_NUM_TRI = _mc_lut.NUM_TRI
+_EDGE_ORIGIN = _mc_lut.EDGE_ORIGIN
+_EDGE_AXIS = _mc_lut.EDGE_AXIS
+
+_cube_index = cuda.jit(device=True)(_mc_lut.cube_index)
+_num_crossings = cuda.jit(device=True)(_mc_lut.num_crossings)
+
+_BLOCK_2D = (16, 16)
+_BLOCK_1D = 256
+
+def is_available() -> bool:
+    return cuda.is_available()
+
+@cuda.jit
+def _mc_count(m, vert_count, tri_count):
+    # One thread per (i, j) row, same layout as the CPU kernel
+    i, j = cuda.grid(2)
+    n0, n1, n2 = m.shape
+    if i >= n0 or j >= n1:
+        return
+    nv = 0
+    for k in range(n2):
+        nv += _num_crossings(m, i, j, k, 3)
+    vert_count[i, j] = nv
+
+    nt = 0
+    if i + 1 < n0 and j + 1 < n1:
+        for k in range(n2 - 1):
+            c = _cube_index(m, i, j, k)
+            if c != 0 and c != 255:
+                nt += _NUM_TRI[c]
+    tri_count[i, j] = nt
+
+@cuda.jit
+def _mc_emit(m, spacing, vert_count, tri_count, vert_start, tri_start, verts, faces):
+    i, j = cuda.grid(2)
+    n0, n1, n2 = m.shape
+    if i >= n0 or j >= n1:
+        return
+
+    if vert_count[i, j] > 0:
+        vid = vert_start[i, j]
+        for k in range(n2):
+            v = m[i, j, k] != 0
+            if i + 1 < n0 and (m[i + 1, j, k] != 0) != v:
+                verts[vid, 0] = (i + 0.5) * spacing[0]
+                verts[vid, 1] = j * spacing[1]
+                verts[vid, 2] = k * spacing[2]
+                vid += 1
+            if j + 1 < n1 and (m[i, j + 1, k] != 0) != v:
+                verts[vid, 0] = i * spacing[0]
+                verts[vid, 1] = (j + 0.5) * spacing[1]
+                verts[vid, 2] = k * spacing[2]
+                vid += 1
+            if k + 1 < n2 and (m[i, j, k + 1] != 0) != v:
+                verts[vid, 0] = i * spacing[0]
+                verts[vid, 1] = j * spacing[1]
+                verts[vid, 2] = (k + 0.5) * spacing[2]
+                vid += 1
+
+    if i + 1 >= n0 or j + 1 >= n1 or tri_count[i, j] == 0:
+        return
+
+    before = cuda.local.array(4, dtype=np.int64)
+    for r in range(4):
+        before[r] = 0
+    tid = tri_start[i, j]
+    for k in range(n2 - 1):
+        c = _cube_index(m, i, j, k)
+        if c != 0 and c != 255:
+            for t in range(_NUM_TRI[c]):
+                for s in range(3):
+                    e = _TRI_TABLE[c, 3 * t + s]
+                    dx = _EDGE_ORIGIN[e, 0]
+                    dy = _EDGE_ORIGIN[e, 1]
+                    dz = _EDGE_ORIGIN[e, 2]
+                    idx = vert_start[i + dx, j + dy] + before[dx + 2 * dy]
+                    if dz:
+                        idx += _num_crossings(m, i + dx, j + dy, k, 3)
+                    idx += _num_crossings(m, i + dx, j + dy, k + dz, _EDGE_AXIS[e])
+                    faces[tid + t, s] = idx
+            tid += _NUM_TRI[c]
+        for r in range(4):
+            before[r] += _num_crossings(m, i + (r & 1), j + (r >> 1), k, 3)
+
+def marching_cubes_cuda(
+    mask: np.ndarray,
+    spacing_mm: Tuple[float, float, float],
+    device_index: int = 0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """CUDA marching cubes for binary masks on GPU ``device_index``; see mesh.marching_cubes_binary."""
+    with cuda.gpus[device_index]:
+        return _marching_cubes_cuda(mask, spacing_mm)
+
+def _marching_cubes_cuda(mask: np.ndarray, spacing_mm) -> Tuple[np.ndarray, np.ndarray]:
+    n0, n1 = mask.shape[:2]
+    grid = (math.ceil(n0 / _BLOCK_2D[0]), math.ceil(n1 / _BLOCK_2D[1]))
+
+    m = cuda.to_device(np.ascontiguousarray(mask))
+    vert_count = cuda.device_array((n0, n1), dtype=np.int64)
+    tri_count = cuda.device_array((n0, n1), dtype=np.int64)
+    _mc_count[grid, _BLOCK_2D](m, vert_count, tri_count)
+
+    # Row offsets are tiny (n0 * n1), so the prefix sum is done on the host
+    vc = vert_count.copy_to_host()
+    tc = tri_count.copy_to_host()
+    num_verts = int(vc.sum())
+    num_faces = int(tc.sum())
+    if num_faces == 0:
+        return np.empty((0, 3), dtype=np.float32), np.empty((0, 3), dtype=np.int32)
+    vert_start = cuda.to_device(np.cumsum(vc, axis=None).reshape(n0, n1) - vc)
+    tri_start = cuda.to_device(np.cumsum(tc, axis=None).reshape(n0, n1) - tc)
+
+    verts = cuda.device_array((num_verts, 3), dtype=np.float32)
+    faces = cuda.device_array((num_faces, 3), dtype=np.int32)
+    _mc_emit[grid, _BLOCK_2D](m, cuda.to_device(np.asarray(spacing_mm, dtype=np.float64)),
+                              vert_count, tri_count, vert_start, tri_start, verts, faces)
+    return verts.copy_to_host(), faces.copy_to_host()
+
+@cuda.jit
+def _smooth_step(crow, col, v, out, coef):
+    # One thread per vertex: out = v + coef * (mean(neighbors) - v), reading v once
+    i = cuda.grid(1)
+    if i >= v.shape[0]:
+        return
+    start = crow[i]
+    end = crow[i + 1]
+    sx = float32(0.0)
+    sy = float32(0.0)
+    sz = float32(0.0)
+    for j in range(start, end):
+        k = col[j]
+        sx += v[k, 0]
+        sy += v[k, 1]
+        sz += v[k, 2]
+    # Isolated vertices have a zero mean, as with the row_sum clamp in smooth.py
+    inv_deg = float32(1.0) / float32(max(end - start, 1))
+    c = float32(coef)
+    out[i, 0] = v[i, 0] + c * (sx * inv_deg - v[i, 0])
+    out[i, 1] = v[i, 1] + c * (sy * inv_deg - v[i, 1])
+    out[i, 2] = v[i, 2] + c * (sz * inv_deg - v[i, 2])
+
+@cuda.jit
+def _smooth_step_half(crow, col, v, v16, out, out16, coef):
+    # As _smooth_step, but neighbors are gathered from an fp16 copy (the bulk of the
+    # reads) while each vertex updates its own fp32 position. Small displacements
+    # therefore accumulate in fp32 instead of rounding away at fp16 resolution.
+    i = cuda.grid(1)
+    if i >= v.shape[0]:
+        return
+    start = crow[i]
+    end = crow[i + 1]
+    sx = float32(0.0)
+    sy = float32(0.0)
+    sz = float32(0.0)
+    for j in range(start, end):
+        k = col[j]
+        sx += float32(v16[k, 0])
+        sy += float32(v16[k, 1])
+        sz += float32(v16[k, 2])
+    inv_deg = float32(1.0) / float32(max(end - start, 1))
+    c = float32(coef)
+    x = v[i, 0] + c * (sx * inv_deg - v[i, 0])
+    y = v[i, 1] + c * (sy * inv_deg - v[i, 1])
+    z = v[i, 2] + c * (sz * inv_deg - v[i, 2])
+    out[i, 0] = x
+    out[i, 1] = y
+    out[i, 2] = z
+    out16[i, 0] = x
+    out16[i, 1] = y
+    out16[i, 2] = z
+
+@cuda.jit
+def _shift_(v, offset, v16):
+    # v -= offset in place, and refresh the fp16 copy from the result
+    i = cuda.grid(1)
+    if i >= v.shape[0]:
+        return
+    for a in range(3):
+        v[i, a] -= offset[a]
+        v16[i, a] = v[i, a]
+
+@cuda.jit
+def _unshift_(v, offset):
+    i = cuda.grid(1)
+    if i >= v.shape[0]:
+        return
+    for a in range(3):
+        v[i, a] += offset[a]
+
+def smooth_csr_(crow, col, v, coefs, num_iter: int, half: bool = False, center=None) -> None:
+    """
+    Smooth vertices in place with one fused kernel launch per sub-step.
+
+    Args:
+        crow, col: CSR row pointers and column indices of the adjacency (device arrays)
+        v: fp32 vertex positions (N, 3) as a device array, updated in place
+        coefs: Step coefficients applied in order each iteration
+               ((weight,) for Laplacian, (lambda, mu) for Taubin)
+        num_iter: Number of iterations
+        half: Gather neighbor positions from an fp16 copy, halving the bytes of the
+              dominant reads. Positions themselves stay fp32.
+        center: (3,) point the fp16 copy is taken relative to (used with ``half``);
+                defaults to the bounding box center of v
+
+    Note:
+        With ``half`` the mesh is first shifted to ``center``, so the fp16 copy
+        only has to resolve coordinates relative to the mesh, not e.g. 400 mm
+        offsets in scanner space.
+    """
+    n = v.shape[0]
+    grid = math.ceil(n / _BLOCK_1D)
+    src, dst = v, cuda.device_array_like(v)
+    if not half:
+        for _ in range(int(num_iter)):
+            for coef in coefs:
+                _smooth_step[grid, _BLOCK_1D](crow, col, src, dst, float(coef))
+                src, dst = dst, src
+    else:
+        if center is None:
+            host = v.copy_to_host()
+            center = (host.min(axis=0) + host.max(axis=0)) * 0.5
+        center = cuda.to_device(np.asarray(center, dtype=np.float32))
+        src16 = cuda.device_array(v.shape, dtype=np.float16)
+        dst16 = cuda.device_array(v.shape, dtype=np.float16)
+        _shift_[grid, _BLOCK_1D](src, center, src16)
+        for _ in range(int(num_iter)):
+            for coef in coefs:
+                _smooth_step_half[grid, _BLOCK_1D](crow, col, src, src16, dst, dst16, float(coef))
+                src, dst = dst, src
+                src16, dst16 = dst16, src16
+        _unshift_[grid, _BLOCK_1D](src, center)
+    if src is not v:
+        v.copy_to_device(src)
+    cuda.synchronize()
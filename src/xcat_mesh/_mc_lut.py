@@ -0,0 +1,320 @@
+"""Lookup tables for marching cubes on binary masks (Lorensen & Cline).
+
+Cube corners and edges follow the classic numbering::
+
+    corner: 0 (0,0,0)  1 (1,0,0)  2 (1,1,0)  3 (0,1,0)
+            4 (0,0,1)  5 (1,0,1)  6 (1,1,1)  7 (0,1,1)
+    edge:   0 c0-c1   1 c1-c2   2 c2-c3   3 c3-c0
+            4 c4-c5   5 c5-c6   6 c6-c7   7 c7-c4
+            8 c0-c4   9 c1-c5  10 c2-c6  11 c3-c7
+
+Bit ``c`` of the cube index is set when corner ``c`` is foreground. The triangle
+table is the one used by ``skimage.measure.marching_cubes(method="lorensen")``,
+so winding (and therefore normals) matches scikit-image.
+"""
+from __future__ import annotations
+import numpy as np
+
+# Up to 5 triangles per cube as triples of edge ids, padded with -1
+TRI_TABLE = np.array([
+    [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  1,  9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 8,  3,  9,  9,  3,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 2, 10,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  8,  3, 10,  1,  2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  0, 10, 10,  0,  2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 2, 10,  3, 10,  8,  3, 10,  9,  8, -1, -1, -1, -1, -1, -1, -1],
+    [11,  2,  3, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [11,  2,  8,  8,  2,  0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  9,  0, 11,  2,  3, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  9,  2,  9, 11,  2,  9,  8, 11, -1, -1, -1, -1, -1, -1, -1],
+    [ 3, 11,  1,  1, 11, 10, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  8,  1,  8, 10,  1,  8, 11, 10, -1, -1, -1, -1, -1, -1, -1],
+    [ 3, 11,  0, 11,  9,  0, 11, 10,  9, -1, -1, -1, -1, -1, -1, -1],
+    [11,  9,  8, 11, 10,  9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  7,  8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  7,  7,  0,  4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  7,  8,  1,  9,  0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  7,  9,  7,  1,  9,  7,  3,  1, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  7,  8, 10,  1,  2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  7,  0,  7,  3,  0, 10,  1,  2, -1, -1, -1, -1, -1, -1, -1],
+    [ 2, 10,  0, 10,  9,  0,  7,  8,  4, -1, -1, -1, -1, -1, -1, -1],
+    [10,  9,  4,  3, 10,  4,  7,  3,  4, 10,  3,  2, -1, -1, -1, -1],
+    [ 8,  4,  7,  2,  3, 11, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [11,  2,  7,  2,  4,  7,  2,  0,  4, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  8,  4,  1,  9,  0,  2,  3, 11, -1, -1, -1, -1, -1, -1, -1],
+    [ 2,  1,  9,  2,  9,  4, 11,  2,  4,  7, 11,  4, -1, -1, -1, -1],
+    [10,  1, 11,  1,  3, 11,  4,  7,  8, -1, -1, -1, -1, -1, -1, -1],
+    [11, 10,  7, 10,  0,  7,  0,  4,  7, 10,  1,  0, -1, -1, -1, -1],
+    [ 8,  4,  7,  9,  3, 11, 10,  9, 11,  0,  3,  9, -1, -1, -1, -1],
+    [ 9,  4,  7, 11,  9,  7, 10,  9, 11, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  5,  4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  5,  4,  3,  0,  8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  1,  4,  4,  1,  5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 8,  3,  4,  3,  5,  4,  3,  1,  5, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  4,  9,  2, 10,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  8,  5,  4,  9, 10,  1,  2, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  4, 10,  4,  2, 10,  4,  0,  2, -1, -1, -1, -1, -1, -1, -1],
+    [ 2, 10,  3,  3, 10,  8, 10,  5,  8,  5,  4,  8, -1, -1, -1, -1],
+    [ 9,  5,  4,  2,  3, 11, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [11,  2,  8,  2,  0,  8,  5,  4,  9, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  4,  1,  4,  0,  1, 11,  2,  3, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  5,  4, 11,  1,  4,  8, 11,  4,  2,  1, 11, -1, -1, -1, -1],
+    [ 3, 11,  1, 11, 10,  1,  4,  9,  5, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  5,  4, 10,  0,  8, 11, 10,  8,  1,  0, 10, -1, -1, -1, -1],
+    [ 4,  0,  5,  0, 11,  5, 11, 10,  5, 11,  0,  3, -1, -1, -1, -1],
+    [10,  5,  4,  8, 10,  4, 11, 10,  8, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  5,  8,  8,  5,  7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  5,  0,  5,  3,  0,  5,  7,  3, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  1,  8,  1,  7,  8,  1,  5,  7, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  5,  7,  1,  5,  3, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  8,  5,  8,  9,  5,  2, 10,  1, -1, -1, -1, -1, -1, -1, -1],
+    [10,  1,  2,  9,  3,  0,  9,  5,  3,  5,  7,  3, -1, -1, -1, -1],
+    [ 0,  2,  8,  2,  5,  8,  5,  7,  8,  2, 10,  5, -1, -1, -1, -1],
+    [ 3,  2, 10,  5,  3, 10,  7,  3,  5, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  5,  8,  5,  7,  8,  2,  3, 11, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  7, 11,  0,  5, 11,  2,  0, 11,  5,  0,  9, -1, -1, -1, -1],
+    [ 2,  3, 11,  0,  7,  8,  0,  1,  7,  1,  5,  7, -1, -1, -1, -1],
+    [ 7, 11,  2,  1,  7,  2,  5,  7,  1, -1, -1, -1, -1, -1, -1, -1],
+    [11, 10,  3, 10,  1,  3,  8,  5,  7,  8,  9,  5, -1, -1, -1, -1],
+    [ 0, 11, 10,  1,  0, 10,  0,  7, 11,  5,  0,  9,  0,  5,  7, -1],
+    [ 0,  5,  7,  8,  0,  7,  0, 10,  5, 11,  0,  3,  0, 11, 10, -1],
+    [10,  5,  7, 10,  7, 11, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 5, 10,  6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  8, 10,  6,  5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [10,  6,  5,  0,  1,  9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 8,  3,  9,  3,  1,  9,  6,  5, 10, -1, -1, -1, -1, -1, -1, -1],
+    [ 6,  5,  2,  2,  5,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6,  5,  2,  5,  1,  2,  8,  3,  0, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  0,  5,  0,  6,  5,  0,  2,  6, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  8,  5,  8,  2,  5,  2,  6,  5,  8,  3,  2, -1, -1, -1, -1],
+    [ 2,  3, 11,  5, 10,  6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  8,  2,  8, 11,  2,  5, 10,  6, -1, -1, -1, -1, -1, -1, -1],
+    [11,  2,  3,  9,  0,  1,  5, 10,  6, -1, -1, -1, -1, -1, -1, -1],
+    [10,  6,  5, 11,  1,  9,  8, 11,  9,  2,  1, 11, -1, -1, -1, -1],
+    [ 6,  5, 11,  5,  3, 11,  5,  1,  3, -1, -1, -1, -1, -1, -1, -1],
+    [ 8, 11,  0, 11,  5,  0,  5,  1,  0,  5, 11,  6, -1, -1, -1, -1],
+    [ 6,  5, 11, 11,  5,  3,  5,  9,  3,  9,  0,  3, -1, -1, -1, -1],
+    [11,  6,  5,  9, 11,  5,  8, 11,  9, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  8,  4, 10,  6,  5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  7,  0,  4,  7, 10,  6,  5, -1, -1, -1, -1, -1, -1, -1],
+    [ 8,  4,  7, 10,  6,  5,  1,  9,  0, -1, -1, -1, -1, -1, -1, -1],
+    [ 5, 10,  6,  1,  4,  7,  3,  1,  7,  9,  4,  1, -1, -1, -1, -1],
+    [ 1,  2,  5,  2,  6,  5,  8,  4,  7, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  1,  6,  1,  2,  6,  7,  0,  4,  7,  3,  0, -1, -1, -1, -1],
+    [ 4,  7,  8,  6,  9,  0,  2,  6,  0,  5,  9,  6, -1, -1, -1, -1],
+    [ 9,  2,  6,  5,  9,  6,  9,  3,  2,  7,  9,  4,  9,  7,  3, -1],
+    [ 4,  7,  8,  2,  3, 11, 10,  6,  5, -1, -1, -1, -1, -1, -1, -1],
+    [10,  6,  5, 11,  4,  7, 11,  2,  4,  2,  0,  4, -1, -1, -1, -1],
+    [ 4,  7,  8,  0,  1,  9,  2,  3, 11, 10,  6,  5, -1, -1, -1, -1],
+    [ 7, 11,  4, 11,  2,  4,  2,  9,  4,  9,  2,  1, 10,  6,  5, -1],
+    [ 7,  8,  4,  3,  6,  5,  1,  3,  5, 11,  6,  3, -1, -1, -1, -1],
+    [11,  0,  4,  7, 11,  4, 11,  1,  0,  5, 11,  6, 11,  5,  1, -1],
+    [11,  6,  3,  6,  5,  3,  5,  0,  3,  0,  5,  9,  4,  7,  8, -1],
+    [11,  6,  5,  9, 11,  5, 11,  4,  7, 11,  9,  4, -1, -1, -1, -1],
+    [ 4,  9,  6,  6,  9, 10, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [10,  6,  9,  6,  4,  9,  3,  0,  8, -1, -1, -1, -1, -1, -1, -1],
+    [10,  6,  1,  6,  0,  1,  6,  4,  0, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  1,  8,  1,  6,  8,  6,  4,  8,  6,  1, 10, -1, -1, -1, -1],
+    [ 1,  2,  9,  2,  4,  9,  2,  6,  4, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  8,  1,  4,  9,  1,  2,  4,  2,  6,  4, -1, -1, -1, -1],
+    [ 0,  6,  4,  0,  2,  6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  8,  3,  2,  4,  3,  6,  4,  2, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  9,  6,  9, 10,  6,  3, 11,  2, -1, -1, -1, -1, -1, -1, -1],
+    [11,  0,  8,  2,  0, 11,  6,  4,  9, 10,  6,  9, -1, -1, -1, -1],
+    [ 2,  3, 11,  0, 10,  6,  4,  0,  6,  1, 10,  0, -1, -1, -1, -1],
+    [ 1,  8, 11,  2,  1, 11,  1,  4,  8,  6,  1, 10,  1,  6,  4, -1],
+    [ 6,  4, 11,  4,  1, 11,  1,  3, 11,  4,  9,  1, -1, -1, -1, -1],
+    [ 1,  6,  4,  9,  1,  4,  1, 11,  6,  8,  1,  0,  1,  8, 11, -1],
+    [ 0,  3, 11,  6,  0, 11,  4,  0,  6, -1, -1, -1, -1, -1, -1, -1],
+    [11,  6,  4, 11,  4,  8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  8,  6,  8, 10,  6,  8,  9, 10, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  3,  0, 10,  7,  0,  9, 10,  0,  6,  7, 10, -1, -1, -1, -1],
+    [ 1, 10,  6,  1,  6,  7,  0,  1,  7,  8,  0,  7, -1, -1, -1, -1],
+    [ 1, 10,  6,  7,  1,  6,  3,  1,  7, -1, -1, -1, -1, -1, -1, -1],
+    [ 2,  6,  7,  9,  2,  7,  8,  9,  7,  2,  9,  1, -1, -1, -1, -1],
+    [ 9,  7,  3,  0,  9,  3,  9,  6,  7,  2,  9,  1,  9,  2,  6, -1],
+    [ 6,  7,  8,  0,  6,  8,  2,  6,  0, -1, -1, -1, -1, -1, -1, -1],
+    [ 6,  7,  3,  6,  3,  2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [11,  2,  3, 10,  7,  8,  9, 10,  8,  6,  7, 10, -1, -1, -1, -1],
+    [ 7,  9, 10,  6,  7, 10,  7,  0,  9,  2,  7, 11,  7,  2,  0, -1],
+    [ 8,  0,  7,  0,  1,  7,  1,  6,  7,  6,  1, 10,  2,  3, 11, -1],
+    [ 7, 11,  2,  1,  7,  2,  7, 10,  6,  7,  1, 10, -1, -1, -1, -1],
+    [ 6,  1,  3, 11,  6,  3,  6,  9,  1,  8,  6,  7,  6,  8,  9, -1],
+    [11,  6,  7,  9,  1,  0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  3, 11,  6,  0, 11,  0,  7,  8,  0,  6,  7, -1, -1, -1, -1],
+    [11,  6,  7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, 11,  7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  8,  6, 11,  7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, 11,  7,  1,  9,  0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  9,  3,  9,  8,  3,  6, 11,  7, -1, -1, -1, -1, -1, -1, -1],
+    [11,  7,  6,  1,  2, 10, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, 11,  7,  0,  8,  3,  1,  2, 10, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  0, 10,  0,  2, 10,  7,  6, 11, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, 11,  7,  2,  8,  3,  2, 10,  8, 10,  9,  8, -1, -1, -1, -1],
+    [ 7,  6,  3,  3,  6,  2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  6,  8,  6,  0,  8,  6,  2,  0, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  6,  3,  6,  2,  3,  9,  0,  1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6,  2,  7,  2,  9,  7,  9,  8,  7,  9,  2,  1, -1, -1, -1, -1],
+    [10,  1,  6,  1,  7,  6,  1,  3,  7, -1, -1, -1, -1, -1, -1, -1],
+    [10,  1,  6,  6,  1,  7,  1,  0,  7,  0,  8,  7, -1, -1, -1, -1],
+    [ 3,  7,  0,  7, 10,  0, 10,  9,  0,  7,  6, 10, -1, -1, -1, -1],
+    [ 8,  7,  6, 10,  8,  6,  9,  8, 10, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, 11,  4,  4, 11,  8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0, 11,  0,  6, 11,  0,  4,  6, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, 11,  4, 11,  8,  4,  1,  9,  0, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  6, 11,  1,  4, 11,  3,  1, 11,  9,  4,  1, -1, -1, -1, -1],
+    [ 8,  4, 11,  4,  6, 11,  1,  2, 10, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  2, 10,  3,  6, 11,  3,  0,  6,  0,  4,  6, -1, -1, -1, -1],
+    [ 0,  2,  9,  2, 10,  9,  4, 11,  8,  4,  6, 11, -1, -1, -1, -1],
+    [ 3,  4,  6, 11,  3,  6,  3,  9,  4, 10,  3,  2,  3, 10,  9, -1],
+    [ 8,  4,  3,  4,  2,  3,  4,  6,  2, -1, -1, -1, -1, -1, -1, -1],
+    [ 6,  0,  4,  2,  0,  6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  1,  9,  2,  8,  4,  6,  2,  4,  3,  8,  2, -1, -1, -1, -1],
+    [ 2,  1,  9,  4,  2,  9,  6,  2,  4, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  3,  8,  6,  1,  8,  4,  6,  8,  1,  6, 10, -1, -1, -1, -1],
+    [ 6, 10,  1,  0,  6,  1,  4,  6,  0, -1, -1, -1, -1, -1, -1, -1],
+    [ 3, 10,  9,  0,  3,  9,  3,  6, 10,  4,  3,  8,  3,  4,  6, -1],
+    [ 9,  4,  6,  9,  6, 10, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, 11,  7,  9,  5,  4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  8,  3,  6, 11,  7,  5,  4,  9, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  1,  4,  1,  5,  4, 11,  7,  6, -1, -1, -1, -1, -1, -1, -1],
+    [11,  7,  6,  8,  5,  4,  8,  3,  5,  3,  1,  5, -1, -1, -1, -1],
+    [ 9,  5,  4, 11,  7,  6,  2, 10,  1, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  2, 10,  6, 11,  7,  3,  0,  8,  5,  4,  9, -1, -1, -1, -1],
+    [ 6, 11,  7,  2,  5,  4,  0,  2,  4, 10,  5,  2, -1, -1, -1, -1],
+    [ 3,  2,  8,  2, 10,  8, 10,  4,  8,  4, 10,  5,  6, 11,  7, -1],
+    [ 2,  3,  6,  3,  7,  6,  9,  5,  4, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  4,  9,  7,  0,  8,  7,  6,  0,  6,  2,  0, -1, -1, -1, -1],
+    [ 0,  5,  4,  1,  5,  0,  3,  7,  6,  2,  3,  6, -1, -1, -1, -1],
+    [ 8,  1,  5,  4,  8,  5,  8,  2,  1,  6,  8,  7,  8,  6,  2, -1],
+    [ 9,  5,  4, 10,  7,  6, 10,  1,  7,  1,  3,  7, -1, -1, -1, -1],
+    [ 6, 10,  7, 10,  1,  7,  1,  8,  7,  8,  1,  0,  9,  5,  4, -1],
+    [10,  3,  7,  6, 10,  7, 10,  0,  3,  4, 10,  5, 10,  4,  0, -1],
+    [ 8,  7,  6, 10,  8,  6,  8,  5,  4,  8, 10,  5, -1, -1, -1, -1],
+    [ 6, 11,  5, 11,  9,  5, 11,  8,  9, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  6, 11,  5, 11,  3,  9,  5,  3,  0,  9,  3, -1, -1, -1, -1],
+    [11,  8,  0,  5, 11,  0,  1,  5,  0, 11,  5,  6, -1, -1, -1, -1],
+    [ 5,  6, 11,  3,  5, 11,  1,  5,  3, -1, -1, -1, -1, -1, -1, -1],
+    [ 2, 10,  1,  6,  9,  5,  6, 11,  9, 11,  8,  9, -1, -1, -1, -1],
+    [ 0,  9,  3,  9,  5,  3,  5, 11,  3, 11,  5,  6, 10,  1,  2, -1],
+    [ 5,  0,  2, 10,  5,  2,  5,  8,  0, 11,  5,  6,  5, 11,  8, -1],
+    [ 3,  2, 10,  5,  3, 10,  3,  6, 11,  3,  5,  6, -1, -1, -1, -1],
+    [ 8,  9,  5,  2,  8,  5,  6,  2,  5,  3,  8,  2, -1, -1, -1, -1],
+    [ 0,  9,  5,  6,  0,  5,  2,  0,  6, -1, -1, -1, -1, -1, -1, -1],
+    [ 8,  6,  2,  3,  8,  2,  8,  5,  6,  1,  8,  0,  8,  1,  5, -1],
+    [ 5,  6,  2,  5,  2,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6,  8,  9,  5,  6,  9,  6,  3,  8,  1,  6, 10,  6,  1,  3, -1],
+    [ 6, 10,  1,  0,  6,  1,  6,  9,  5,  6,  0,  9, -1, -1, -1, -1],
+    [ 0,  3,  8,  6, 10,  5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [10,  5,  6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 5, 10,  7,  7, 10, 11, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 5, 10,  7, 10, 11,  7,  0,  8,  3, -1, -1, -1, -1, -1, -1, -1],
+    [11,  7, 10,  7,  5, 10,  0,  1,  9, -1, -1, -1, -1, -1, -1, -1],
+    [ 5, 11,  7, 10, 11,  5,  9,  8,  3,  1,  9,  3, -1, -1, -1, -1],
+    [11,  7,  2,  7,  1,  2,  7,  5,  1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  0,  8,  1, 11,  7,  5,  1,  7,  2, 11,  1, -1, -1, -1, -1],
+    [ 7,  5, 11,  5,  0, 11,  0,  2, 11,  0,  5,  9, -1, -1, -1, -1],
+    [ 2,  9,  8,  3,  2,  8,  2,  5,  9,  7,  2, 11,  2,  7,  5, -1],
+    [ 2,  3, 10,  3,  5, 10,  3,  7,  5, -1, -1, -1, -1, -1, -1, -1],
+    [ 2,  0,  8,  5,  2,  8,  7,  5,  8, 10,  2,  5, -1, -1, -1, -1],
+    [ 1,  9,  0,  5,  2,  3,  7,  5,  3, 10,  2,  5, -1, -1, -1, -1],
+    [ 2,  7,  5, 10,  2,  5,  2,  8,  7,  9,  2,  1,  2,  9,  8, -1],
+    [ 5,  3,  7,  5,  1,  3, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  0,  8,  7,  1,  8,  5,  1,  7, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  9,  0,  3,  5,  0,  7,  5,  3, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  9,  8,  5,  8,  7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 5, 10,  4, 10,  8,  4, 10, 11,  8, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  4,  5, 11,  0,  5, 10, 11,  5,  0, 11,  3, -1, -1, -1, -1],
+    [ 1,  9,  0,  5,  8,  4,  5, 10,  8, 10, 11,  8, -1, -1, -1, -1],
+    [ 4,  3,  1,  9,  4,  1,  4, 11,  3, 10,  4,  5,  4, 10, 11, -1],
+    [ 5,  1,  4,  1, 11,  4, 11,  8,  4,  1,  2, 11, -1, -1, -1, -1],
+    [11,  5,  1,  2, 11,  1, 11,  4,  5,  0, 11,  3, 11,  0,  4, -1],
+    [ 5, 11,  8,  4,  5,  8,  5,  2, 11,  0,  5,  9,  5,  0,  2, -1],
+    [ 5,  9,  4,  3,  2, 11, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [10,  2,  3, 10,  3,  8,  5, 10,  8,  4,  5,  8, -1, -1, -1, -1],
+    [ 4,  5, 10,  2,  4, 10,  0,  4,  2, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  5,  8,  5, 10,  8, 10,  3,  8,  3, 10,  2,  1,  9,  0, -1],
+    [ 4,  5, 10,  2,  4, 10,  4,  1,  9,  4,  2,  1, -1, -1, -1, -1],
+    [ 3,  8,  4,  5,  3,  4,  1,  3,  5, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  0,  4,  1,  4,  5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 5,  9,  0,  3,  5,  0,  5,  8,  4,  5,  3,  8, -1, -1, -1, -1],
+    [ 5,  9,  4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  9,  7,  9, 11,  7,  9, 10, 11, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  8,  3,  4, 11,  7,  4,  9, 11,  9, 10, 11, -1, -1, -1, -1],
+    [10, 11,  7,  0, 10,  7,  4,  0,  7,  1, 10,  0, -1, -1, -1, -1],
+    [ 4, 10, 11,  7,  4, 11,  4,  1, 10,  3,  4,  8,  4,  3,  1, -1],
+    [ 1,  2,  9,  9,  2,  4,  2, 11,  4, 11,  7,  4, -1, -1, -1, -1],
+    [ 9,  1,  4,  1,  2,  4,  2,  7,  4,  7,  2, 11,  3,  0,  8, -1],
+    [ 2, 11,  7,  4,  2,  7,  0,  2,  4, -1, -1, -1, -1, -1, -1, -1],
+    [ 4,  8,  3,  2,  4,  3,  4, 11,  7,  4,  2, 11, -1, -1, -1, -1],
+    [ 9, 10,  4, 10,  3,  4,  3,  7,  4,  3, 10,  2, -1, -1, -1, -1],
+    [ 7,  2,  0,  8,  7,  0,  7, 10,  2,  9,  7,  4,  7,  9, 10, -1],
+    [10,  4,  0,  1, 10,  0, 10,  7,  4,  3, 10,  2, 10,  3,  7, -1],
+    [ 7,  4,  8,  1, 10,  2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  4,  9,  1,  7,  9,  3,  7,  1, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  4,  9,  1,  7,  9,  7,  0,  8,  7,  1,  0, -1, -1, -1, -1],
+    [ 0,  3,  7,  0,  7,  4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 7,  4,  8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 9, 11,  8, 10, 11,  9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [11,  3,  0,  9, 11,  0, 10, 11,  9, -1, -1, -1, -1, -1, -1, -1],
+    [ 8,  0,  1, 10,  8,  1, 11,  8, 10, -1, -1, -1, -1, -1, -1, -1],
+    [11,  3,  1, 11,  1, 10, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  1,  2, 11,  9,  2,  8,  9, 11, -1, -1, -1, -1, -1, -1, -1],
+    [ 9,  1,  2, 11,  9,  2,  9,  3,  0,  9, 11,  3, -1, -1, -1, -1],
+    [ 2, 11,  8,  2,  8,  0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 2, 11,  3, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [10,  2,  3,  8, 10,  3,  9, 10,  8, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  9, 10,  0, 10,  2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 8,  0,  1, 10,  8,  1,  8,  2,  3,  8, 10,  2, -1, -1, -1, -1],
+    [10,  2,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 3,  8,  9,  3,  9,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 1,  0,  9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 0,  3,  8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+], dtype=np.int8)
+
+# Number of triangles per cube index
+NUM_TRI = ((TRI_TABLE >= 0).sum(axis=1) // 3).astype(np.int8)
+
+# Each cube edge as a grid edge: start corner offset (dx, dy, dz) and axis
+EDGE_ORIGIN = np.array([
+    [0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 0],
+    [0, 0, 1], [1, 0, 1], [0, 1, 1], [0, 0, 1],
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+], dtype=np.int8)
+EDGE_AXIS = np.array([0, 1, 0, 1, 0, 1, 0, 1, 2, 2, 2, 2], dtype=np.int8)
+
+def cube_index(m, i, j, k):
+    """Cube index of the cell with lowest corner (i, j, k)."""
+    c = 0
+    if m[i, j, k]:
+        c |= 1
+    if m[i + 1, j, k]:
+        c |= 2
+    if m[i + 1, j + 1, k]:
+        c |= 4
+    if m[i, j + 1, k]:
+        c |= 8
+    if m[i, j, k + 1]:
+        c |= 16
+    if m[i + 1, j, k + 1]:
+        c |= 32
+    if m[i + 1, j + 1, k + 1]:
+        c |= 64
+    if m[i, j + 1, k + 1]:
+        c |= 128
+    return c
+
+def num_crossings(m, x, y, z, upto):
+    """Number of surface-crossing grid edges starting at (x, y, z) along axes < upto."""
+    v = m[x, y, z] != 0
+    n = 0
+    if upto > 0 and x + 1 < m.shape[0] and (m[x + 1, y, z] != 0) != v:
+        n += 1
+    if upto > 1 and y + 1 < m.shape[1] and (m[x, y + 1, z] != 0) != v:
+        n += 1
+    if upto > 2 and z + 1 < m.shape[2] and (m[x, y, z + 1] != 0) != v:
+        n += 1
+    return n
@@ -15,18 +15,26 @@ class SmoothConfig:
     lambda_: float = 0.5        # taubin
     mu: float = -0.53           # taubin
     device: str = "cpu"
+    precision: str = "fp32"     # "fp32" | "fp16" (GPU vertex storage)
 
 @dataclass(frozen=True)
 class OutputConfig:
     mesh_unsmoothed_path: Optional[str] = None
     mesh_smoothed_path: Optional[str] = None
+    float_precision: int = 4    # digits after the decimal point for OBJ vertices
+
+@dataclass(frozen=True)
+class IOConfig:
+    fast_gzip: bool = False     # opt-in large-chunk gzip reads (patches the stdlib)
 
 @dataclass(frozen=True)
 class MeshConfig:
     target_resolution_mm: Optional[Tuple[float, float, float]] = (1.0, 1.0, 1.0)
     reorient_canonical: bool = True
+    marching_cubes: str = "dense"   # "dense" | "sparse"
     smooth: SmoothConfig = SmoothConfig()
     output: OutputConfig = OutputConfig()
+    io: IOConfig = IOConfig()
 
 def load_config(path: str | Path) -> MeshConfig:
     p = Path(path)
@@ -44,6 +52,10 @@ def load_config(path: str | Path) -> MeshConfig:
 
     reorient = bool(data.get("reorient_canonical", True))
 
+    mc = str(data.get("marching_cubes", "dense")).lower()
+    if mc not in {"dense", "sparse"}:
+        raise ConfigError("marching_cubes must be one of: dense, sparse")
+
     s = data.get("smooth", {}) or {}
     smooth = SmoothConfig(
         enabled=bool(s.get("enabled", True)),
@@ -53,22 +65,33 @@ def load_config(path: str | Path) -> MeshConfig:
         lambda_=float(s.get("lambda", 0.5)),
         mu=float(s.get("mu", -0.53)),
         device=str(s.get("device", "cpu")),
+        precision=str(s.get("precision", "fp32")).lower(),
     )
 
     if smooth.method not in {"laplacian", "taubin", "none"}:
         raise ConfigError("smooth.method must be one of: laplacian, taubin, none")
+    if smooth.precision not in {"fp32", "fp16"}:
+        raise ConfigError("smooth.precision must be one of: fp32, fp16")
 
 
     o = data.get("output", {}) or {}
     output = OutputConfig(
         mesh_unsmoothed_path=o.get("mesh_unsmoothed_path"),
         mesh_smoothed_path=o.get("mesh_smoothed_path"),
+        float_precision=int(o.get("float_precision", 4)),
     )
 
     if not (output.mesh_unsmoothed_path or output.mesh_smoothed_path):
         raise ConfigError(
             "Config.output must specify at least one of mesh_unsmoothed_path or mesh_smoothed_path."
         )
+    if not (0 <= output.float_precision <= 9):
+        raise ConfigError("output.float_precision must be in [0, 9]")
+
+    i = data.get("io", {}) or {}
+    io = IOConfig(
+        fast_gzip=bool(i.get("fast_gzip", False)),
+    )
 
     if smooth.num_iter < 0:
         raise ConfigError("smooth.num_iter must be >= 0")
@@ -78,14 +101,17 @@ def load_config(path: str | Path) -> MeshConfig:
     return MeshConfig(
         target_resolution_mm=tr,
         reorient_canonical=reorient,
+        marching_cubes=mc,
         smooth=smooth,
         output=output,
+        io=io,
     )
 
 def default_config_dict() -> Dict[str, Any]:
     return {
         "target_resolution_mm": [1.0, 1.0, 1.0],
         "reorient_canonical": True,
+        "marching_cubes": "dense",
         "smooth": {
             "enabled": True,
             "method": "laplacian",
@@ -93,10 +119,15 @@ def default_config_dict() -> Dict[str, Any]:
             "weight": 0.1,
             "lambda": 0.5,
             "mu": -0.53,
-            "device": "cpu"
+            "device": "cpu",
+            "precision": "fp32"
         },
         "output": {
             "mesh_unsmoothed_path": "mesh_raw.obj",
-            "mesh_smoothed_path": "mesh_smooth.obj"
+            "mesh_smoothed_path": "mesh_smooth.obj",
+            "float_precision": 4
+        },
+        "io": {
+            "fast_gzip": False
         },
     }
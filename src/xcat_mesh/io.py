@@ -1,53 +1,161 @@
 from __future__ import annotations
+import gzip
+import io as _stdio
 from pathlib import Path
 from typing import Tuple
 import numpy as np
 import nibabel as nib
 
-def load_nifti_mask(path: str | Path, reorient_canonical: bool = True) -> Tuple[np.ndarray, Tuple[float, float, float]]:
+try:
+    # Optional: nibabel uses indexed_gzip for .nii.gz when importable, which keeps the
+    # decompressor state instead of re-reading the file from the start on each access
+    import indexed_gzip  # noqa: F401
+    HAVE_INDEXED_GZIP = True
+except ImportError:
+    HAVE_INDEXED_GZIP = False
+
+# Compressed bytes fed to zlib per call once enable_fast_gzip() is applied
+_GZIP_READ_SIZE = _stdio.DEFAULT_BUFFER_SIZE * 256
+_fast_gzip_enabled = False
+
+def enable_fast_gzip() -> None:
     """
-    Load NIfTI mask and return (mask_array, voxel_spacing_mm).
+    Make gzip decompress in large chunks instead of 8 KiB reads.
+
+    Restores the large-chunk behaviour that CPython dropped along with
+    GzipFile.max_read_chunk (the same patch Nilearn applies). Process-wide
+    and idempotent. Opt-in: it relies on private gzip internals and is not
+    faster on every file (measure before enabling it).
+    """
+    global _fast_gzip_enabled
+    if _fast_gzip_enabled:
+        return
+    if hasattr(gzip.GzipFile, "max_read_chunk"):
+        gzip.GzipFile.max_read_chunk = 100 * 1024 * 1024
+    if hasattr(gzip, "READ_BUFFER_SIZE"):
+        # Python >= 3.12 exposes the read size directly
+        gzip.READ_BUFFER_SIZE = _GZIP_READ_SIZE
+    else:
+        # Defined here so importing this module never touches private gzip names
+        class _LargeReadPaddedFile(gzip._PaddedFile):
+            def read(self, size):
+                # Before 3.12, _GzipReader pulls compressed data in io.DEFAULT_BUFFER_SIZE
+                # pieces; header fields are read with their own (small) exact sizes
+                if size == _stdio.DEFAULT_BUFFER_SIZE:
+                    size = _GZIP_READ_SIZE
+                return super().read(size)
+
+        gzip._PaddedFile = _LargeReadPaddedFile
+    _fast_gzip_enabled = True
+
+# OBJ export: rows formatted per write, and the file buffer size
+_OBJ_CHUNK_ROWS = 65536
+_OBJ_WRITE_BUFFER = 4 << 20
+
+def load_nifti_data(
+    path: str | Path,
+    reorient_canonical: bool = True,
+    fast_gzip: bool = False,
+) -> Tuple[np.ndarray, Tuple[float, float, float]]:
+    """
+    Load NIfTI voxel data in its stored dtype and return (data, voxel_spacing_mm).
 
     Args:
         path: Path to NIfTI file (.nii or .nii.gz)
         reorient_canonical: If True, reorient to RAS+ canonical orientation
+        fast_gzip: If True and indexed_gzip is unavailable, apply enable_fast_gzip()
 
     Returns:
-        Tuple of (mask array, voxel spacing in mm)
+        Tuple of (data array, voxel spacing in mm)
+
+    Note:
+        Unlike img.get_fdata(), this does not upcast to float64 (scaled images
+        still come back as floats).
     """
-    img = nib.load(str(path))
-    if reorient_canonical:
-        img = nib.as_closest_canonical(img)
+    if fast_gzip and not HAVE_INDEXED_GZIP:
+        enable_fast_gzip()
 
-    data = img.get_fdata()  # float64
+    img = nib.load(str(path), keep_file_open=True)
 
-    # Convert to compact integer type (validation happens later in pipeline)
-    mask = data.astype(np.uint8)
+    # Read straight from the array proxy: stored dtype, no float64 detour and no
+    # copy for unscaled data
+    data = np.asanyarray(img.dataobj)
 
-    zooms = img.header.get_zooms()
     # Handle both 3D and 4D NIfTI (take first 3 spatial dimensions)
-    spacing = (float(zooms[0]), float(zooms[1]), float(zooms[2]))
+    zooms = [float(z) for z in img.header.get_zooms()[:3]]
+    if reorient_canonical:
+        # Same result as nib.as_closest_canonical, but applied to the loaded array:
+        # only flips/transposes, which are views, and no intermediate image
+        ornt = nib.orientations.io_orientation(img.affine)
+        data = nib.orientations.apply_orientation(data, ornt)
+        canonical = list(zooms)
+        for axis, (new_axis, _flip) in enumerate(ornt):
+            canonical[int(new_axis)] = zooms[axis]
+        zooms = canonical
+
+    spacing = (zooms[0], zooms[1], zooms[2])
+    return data, spacing
+
+def load_nifti_mask(
+    path: str | Path,
+    reorient_canonical: bool = True,
+    fast_gzip: bool = False,
+) -> Tuple[np.ndarray, Tuple[float, float, float]]:
+    """
+    Load NIfTI mask and return (mask_array, voxel_spacing_mm).
+
+    Args:
+        path: Path to NIfTI file (.nii or .nii.gz)
+        reorient_canonical: If True, reorient to RAS+ canonical orientation
+        fast_gzip: If True and indexed_gzip is unavailable, apply enable_fast_gzip()
+
+    Returns:
+        Tuple of (uint8 mask array with values {0, 1}, voxel spacing in mm)
+    """
+    data, spacing = load_nifti_data(path, reorient_canonical=reorient_canonical, fast_gzip=fast_gzip)
+
+    # Threshold and cast in one step, so callers always get a {0,1} uint8 mask
+    mask = (data > 0.5).view(np.uint8)
     return mask, spacing
 
-def save_obj(path: str | Path, verts: np.ndarray, faces: np.ndarray) -> None:
+def _write_rows(f, rows: np.ndarray, row_fmt: str) -> None:
+    """Write a 2D array as formatted text lines, one block of rows per write."""
+    for start in range(0, len(rows), _OBJ_CHUNK_ROWS):
+        chunk = rows[start:start + _OBJ_CHUNK_ROWS]
+        # A single %-format over the whole block keeps the per-row work in C
+        f.write(((row_fmt * len(chunk)) % tuple(chunk.ravel().tolist())).encode("ascii"))
+
+def save_obj(
+    path: str | Path,
+    verts: np.ndarray,
+    faces: np.ndarray,
+    float_precision: int = 6,
+) -> None:
     """
     Save mesh as Wavefront OBJ file.
 
     Args:
-        path: Output path for .obj file
+        path: Output path for .obj file (a .gz suffix writes gzip-compressed OBJ)
         verts: Vertex coordinates (N, 3)
         faces: Triangle face indices (M, 3)
+        float_precision: Digits after the decimal point for vertex coordinates
+
+    Note:
+        Rows are formatted and written block by block, so memory stays bounded
+        by the block size rather than the mesh size.
     """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
+    # Specialize the row format once per call; fewer digits means less to format and write
+    prec = int(float_precision)
+    vfmt = f"v %.{prec}f %.{prec}f %.{prec}f\n"
 
-    with p.open("w") as f:
-        # Write vertices efficiently using vectorized string formatting
-        vertex_lines = '\n'.join(f'v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}' for v in verts)
-        f.write(vertex_lines)
-        f.write('\n')
-
+    if p.suffix == ".gz":
+        # Fastest level: compression overlaps with formatting instead of dominating it
+        f = gzip.open(p, "wb", compresslevel=1)
+    else:
+        f = p.open("wb", buffering=_OBJ_WRITE_BUFFER)
+    with f:
+        _write_rows(f, np.asarray(verts), vfmt)
         # OBJ uses 1-based indexing
-        face_lines = '\n'.join(f'f {int(tri[0])+1} {int(tri[1])+1} {int(tri[2])+1}' for tri in faces)
-        f.write(face_lines)
-        f.write('\n')
+        _write_rows(f, np.asarray(faces) + 1, "f %d %d %d\n")
@@ -3,21 +3,156 @@ from typing import Tuple
 import numpy as np
 from skimage import measure
 
-def marching_cubes_binary(mask: np.ndarray, spacing_mm: Tuple[float, float, float]) -> Tuple[np.ndarray, np.ndarray]:
+# Offsets of the 8 children of a block, in units of the child block size
+_CHILD_OFFSETS = np.array(
+    [(dx, dy, dz) for dx in (0, 1) for dy in (0, 1) for dz in (0, 1)], dtype=np.intp
+)
+
+def _skimage_marching_cubes(mask: np.ndarray, spacing_mm) -> Tuple[np.ndarray, np.ndarray]:
+    # Lorensen table, so the fallback yields the same triangles as the Numba kernels
+    verts, faces, _normals, _values = measure.marching_cubes(
+        mask, level=0.5, spacing=spacing_mm, method="lorensen"
+    )
+    return verts, faces
+
+def marching_cubes_binary(
+    mask: np.ndarray,
+    spacing_mm: Tuple[float, float, float],
+    device: str = "cpu",
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Run marching cubes on a binary mask (values 0/1) and return (verts, faces).
 
     Args:
         mask: Binary 3D mask array with values {0, 1}
         spacing_mm: Voxel spacing (x, y, z) in millimeters
+        device: "cpu", or a "cuda[:N]" device to run extraction on the GPU
+
+    Returns:
+        Tuple of (vertices, faces) where vertices are (N, 3) float32 coordinates
+        and faces are (M, 3) int32 triangle indices
+
+    Note:
+        Uses level=0.5 to extract the isosurface between 0 and 1. With Numba
+        installed (`pip install 'xcat-mesh[fast]'`) a parallel kernel is used that
+        skips uniform cells and places vertices on edge midpoints directly;
+        otherwise falls back to scikit-image with the same (Lorensen) table.
+    """
+    try:
+        if device.startswith("cuda"):
+            from . import _kernels_cuda
+            if _kernels_cuda.is_available():
+                index = int(device.split(":", 1)[1]) if ":" in device else 0
+                return _kernels_cuda.marching_cubes_cuda(mask, spacing_mm, device_index=index)
+        from ._kernels import marching_cubes_numba
+    except ImportError:
+        verts, faces = _skimage_marching_cubes(mask, spacing_mm)
+        return verts.astype(np.float32, copy=False), faces.astype(np.int32, copy=False)
+    return marching_cubes_numba(np.ascontiguousarray(mask), spacing_mm)
+
+def _forward_reduce(a: np.ndarray, op) -> np.ndarray:
+    """Reduce each block with its +1 neighbors along every axis (2x2x2 forward window)."""
+    # Edge padding adds no new values, so blocks on the far border only see themselves
+    p = np.pad(a, ((0, 1), (0, 1), (0, 1)), mode="edge")
+    n0, n1, n2 = a.shape
+    out = a.copy()
+    for dx, dy, dz in _CHILD_OFFSETS[1:]:
+        op(out, p[dx:dx + n0, dy:dy + n1, dz:dz + n2], out=out)
+    return out
+
+def marching_cubes_sparse(
+    mask: np.ndarray,
+    spacing_mm: Tuple[float, float, float],
+    leaf_size: int = 16,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coarse-to-fine marching cubes that only visits blocks straddling the 0.5 level.
+
+    An occupancy pyramid (block max/min) is built once; starting from blocks of
+    roughly D/8 voxels, only blocks containing both 0 and 1 are subdivided until
+    ``leaf_size``. Marching cubes then runs on each active leaf block (plus a
+    1-voxel halo so neighboring blocks share their boundary plane) and the
+    per-block meshes are stitched by merging duplicated boundary vertices.
+
+    Args:
+        mask: Binary 3D mask array with values {0, 1}
+        spacing_mm: Voxel spacing (x, y, z) in millimeters
+        leaf_size: Edge length (in voxels) of the finest blocks passed to marching cubes
 
     Returns:
         Tuple of (vertices, faces) where vertices are (N, 3) float32 coordinates
         and faces are (M, 3) int32 triangle indices
 
     Note:
-        Uses level=0.5 to extract the isosurface between 0 and 1
+        Produces the same triangles as marching_cubes_binary, but vertices are
+        ordered differently. Pays off on large masks where the surface is a thin
+        shell inside a mostly uniform volume.
     """
-    # Use level=0.5 so the surface is between 0 and 1
-    verts, faces, _normals, _values = measure.marching_cubes(mask, level=0.5, spacing=spacing_mm)
-    return verts.astype(np.float32, copy=False), faces.astype(np.int32, copy=False)
+    mask = np.asarray(mask)
+    if mask.ndim != 3:
+        raise ValueError(f"Expected a 3D mask, got shape {mask.shape}")
+    leaf = int(leaf_size)
+    if leaf < 1:
+        raise ValueError("leaf_size must be >= 1")
+
+    # Coarsest level: blocks of ~D/8 voxels, a power-of-two multiple of the leaf size
+    top = leaf
+    while top * 2 <= max(mask.shape) // 8:
+        top *= 2
+
+    # Occupancy pyramid, finest level first. Only the leaf level touches every voxel.
+    # Padding uses the identity of each reduction so partial border blocks stay exact.
+    block_max = measure.block_reduce(mask, (leaf, leaf, leaf), np.max, cval=0)
+    block_min = measure.block_reduce(mask, (leaf, leaf, leaf), np.min, cval=1)
+    active = {}
+    k = leaf
+    while True:
+        # A block straddles the level if its samples [o, o+k] (incl. halo) hold both values
+        active[k] = _forward_reduce(block_max, np.maximum) != _forward_reduce(block_min, np.minimum)
+        if k == top:
+            break
+        block_max = measure.block_reduce(block_max, (2, 2, 2), np.max, cval=0)
+        block_min = measure.block_reduce(block_min, (2, 2, 2), np.min, cval=1)
+        k *= 2
+
+    # (N, 3) voxel origins of active blocks, refined level by level
+    origins = np.argwhere(active[top]) * top
+    while k > leaf:
+        k //= 2
+        level = active[k]
+        children = (origins[:, None, :] + _CHILD_OFFSETS[None, :, :] * k).reshape(-1, 3)
+        idx = children // k
+        inside = np.all(idx < np.array(level.shape), axis=1)
+        children, idx = children[inside], idx[inside]
+        origins = children[level[idx[:, 0], idx[:, 1], idx[:, 2]]]
+
+    vert_chunks = []
+    face_chunks = []
+    num_verts = 0
+    for o0, o1, o2 in origins:
+        patch = mask[o0:o0 + leaf + 1, o1:o1 + leaf + 1, o2:o2 + leaf + 1]
+        if min(patch.shape) < 2 or patch.min() == patch.max():
+            continue
+        v, f = _skimage_marching_cubes(patch, (1.0, 1.0, 1.0))
+        vert_chunks.append(v + np.array((o0, o1, o2)))
+        face_chunks.append(f + num_verts)
+        num_verts += len(v)
+
+    if not vert_chunks:
+        return np.empty((0, 3), dtype=np.float32), np.empty((0, 3), dtype=np.int32)
+
+    verts = np.concatenate(vert_chunks)
+    faces = np.concatenate(face_chunks)
+
+    # Vertices sit on voxel edge midpoints, so doubled coordinates are exact integers.
+    # Pack them into one int64 key to merge the copies shared by neighboring blocks.
+    ix = np.rint(verts * 2.0).astype(np.int64)
+    n1 = 2 * mask.shape[1]
+    n2 = 2 * mask.shape[2]
+    key = (ix[:, 0] * n1 + ix[:, 1]) * n2 + ix[:, 2]
+    key, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    # Scale straight into float32 and remap through an int32 lookup, so no
+    # full-size float64/int64 output is materialized and then downcast
+    verts = np.multiply(ix[first], 0.5 * np.asarray(spacing_mm, dtype=np.float64), dtype=np.float32)
+    faces = inverse.reshape(-1).astype(np.int32)[faces]
+    return verts, faces
@@ -6,11 +6,64 @@ import numpy as np
 from tqdm import tqdm
 
 from .config import load_config, MeshConfig
-from .io import load_nifti_mask, save_obj
+from .errors import EmptyMaskError
+from .io import load_nifti_data, save_obj
 from .validate import assert_binary_mask, assert_non_empty
 from .resample import resample_to_target_resolution
-from .mesh import marching_cubes_binary
-from .smooth import smooth_vertices
+from .mesh import marching_cubes_binary, marching_cubes_sparse
+
+def _prepare_mask(data: np.ndarray) -> np.ndarray:
+    """
+    Validate a loaded volume and binarize it for marching cubes.
+
+    Args:
+        data: Raw NIfTI voxel data
+
+    Returns:
+        uint8 mask with values {0, 1}
+
+    Note:
+        With Numba the 3D check, foreground check and binarization share a single
+        pass over the volume; otherwise binarization and the foreground check
+        are two NumPy passes.
+    """
+    assert_binary_mask(data)
+    try:
+        from ._kernels import prep_mask
+    except ImportError:
+        # Same 0.5 threshold as the kernel; already {0,1}, so no rebinarization needed
+        mask = (data > 0.5).view(np.uint8)
+        assert_non_empty(mask)
+        return mask
+
+    mask01, has_fg = prep_mask(data)
+    if not has_fg:
+        raise EmptyMaskError("Mask contains no foreground voxels (no value above 0.5).")
+    return mask01
+
+def _bbox_uint8(mask: np.ndarray) -> Tuple[Tuple[slice, slice, slice], Tuple[int, int, int]]:
+    """
+    Bounding box of the foreground plus a 1-voxel halo.
+
+    Args:
+        mask: uint8 mask with values {0, 1}
+
+    Returns:
+        Tuple of (slices into mask, voxel origin of the box)
+    """
+    def _span(occupied: np.ndarray, n: int) -> slice:
+        nz = np.flatnonzero(occupied)
+        # Keep one background voxel on each side so the surface closes
+        return slice(max(int(nz[0]) - 1, 0), min(int(nz[-1]) + 2, n))
+
+    # (x, y) footprint first, then the z extent only inside that footprint
+    footprint = mask.any(axis=2)
+    if not footprint.any():
+        return tuple(slice(0, n) for n in mask.shape), (0, 0, 0)
+    sx = _span(footprint.any(axis=1), mask.shape[0])
+    sy = _span(footprint.any(axis=0), mask.shape[1])
+    sz = _span(mask[sx, sy].any(axis=(0, 1)), mask.shape[2])
+    return (sx, sy, sz), (sx.start, sy.start, sz.start)
 
 def mesh_from_nifti(nifti_path: str | Path, cfg: MeshConfig):
     """
@@ -25,12 +78,14 @@ def mesh_from_nifti(nifti_path: str | Path, cfg: MeshConfig):
     """
     with tqdm(total=5, desc="Mesh generation", unit="step") as pbar:
         pbar.set_description("Loading NIfTI mask")
-        mask, spacing = load_nifti_mask(nifti_path, reorient_canonical=cfg.reorient_canonical)
+        data, spacing = load_nifti_data(
+            nifti_path, reorient_canonical=cfg.reorient_canonical, fast_gzip=cfg.io.fast_gzip
+        )
         pbar.update(1)
 
         pbar.set_description("Validating mask")
-        assert_binary_mask(mask)
-        assert_non_empty(mask)
+        mask = _prepare_mask(data)
+        del data
         pbar.update(1)
 
         if cfg.target_resolution_mm is not None:
@@ -38,16 +93,23 @@ def mesh_from_nifti(nifti_path: str | Path, cfg: MeshConfig):
             mask, spacing = resample_to_target_resolution(mask, spacing, cfg.target_resolution_mm)
         pbar.update(1)
 
-        # Marching cubes expects numeric array; ensure 0/1
-        mask01 = (mask == 1).astype(np.uint8)
-
         pbar.set_description("Running marching cubes")
-        verts, faces = marching_cubes_binary(mask01, spacing)
+        # Only the foreground bounding box can produce triangles
+        crop, origin = _bbox_uint8(mask)
+        if cfg.marching_cubes == "sparse":
+            verts, faces = marching_cubes_sparse(mask[crop], spacing)
+        else:
+            verts, faces = marching_cubes_binary(mask[crop], spacing, device=cfg.smooth.device)
+        if any(origin):
+            # verts is a fresh float32 array from marching cubes, so shift it in place
+            verts += np.multiply(origin, spacing).astype(np.float32)
         pbar.update(1)
 
         smoothed = None
         if cfg.smooth.enabled and cfg.smooth.num_iter > 0 and cfg.smooth.weight > 0.0:
             pbar.set_description(f"Smoothing ({cfg.smooth.method}, {cfg.smooth.num_iter} iter)")
+            # Imported here so unsmoothed runs never pay for the smoothing backends
+            from .smooth import smooth_vertices
             smoothed = smooth_vertices(
                 verts, faces,
                 method=cfg.smooth.method,
@@ -56,6 +118,7 @@ def mesh_from_nifti(nifti_path: str | Path, cfg: MeshConfig):
                 lambda_=cfg.smooth.lambda_,
                 mu=cfg.smooth.mu,
                 device=cfg.smooth.device,
+                precision=cfg.smooth.precision,
             )
         pbar.update(1)
 
@@ -76,13 +139,13 @@ def run(nifti_path: str | Path, config_path: str | Path) -> None:
 
     if cfg.output.mesh_unsmoothed_path:
         print(f"Saving unsmoothed mesh to: {cfg.output.mesh_unsmoothed_path}")
-        save_obj(cfg.output.mesh_unsmoothed_path, verts, faces)
+        save_obj(cfg.output.mesh_unsmoothed_path, verts, faces, cfg.output.float_precision)
 
     if cfg.output.mesh_smoothed_path:
         if smoothed is None:
             # If smoothing disabled but user asked for smoothed output, fall back to raw
             print(f"Saving mesh to: {cfg.output.mesh_smoothed_path}")
-            save_obj(cfg.output.mesh_smoothed_path, verts, faces)
+            save_obj(cfg.output.mesh_smoothed_path, verts, faces, cfg.output.float_precision)
         else:
             print(f"Saving smoothed mesh to: {cfg.output.mesh_smoothed_path}")
-            save_obj(cfg.output.mesh_smoothed_path, smoothed, faces)
+            save_obj(cfg.output.mesh_smoothed_path, smoothed, faces, cfg.output.float_precision)
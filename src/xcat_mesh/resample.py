@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import Tuple
 import numpy as np
-from scipy.ndimage import zoom
 
 def resample_to_target_resolution(
     mask: np.ndarray,
@@ -20,7 +19,11 @@ def resample_to_target_resolution(
         Tuple of (resampled mask, target spacing)
 
     Note:
-        Uses order=0 (nearest neighbor) interpolation to preserve label values
+        Nearest neighbor to preserve label values, done as a plain index gather:
+        output voxel i takes source voxel rint(i / factor), clamped to the input.
+        Both grids share voxel 0 at the origin (vertex = index * spacing), so this
+        is the nearest source sample; floor(i / factor) would bias the mesh by up
+        to one source voxel.
     """
     sx, sy, sz = spacing_mm
     tx, ty, tz = target_mm
@@ -28,7 +31,14 @@ def resample_to_target_resolution(
     # zoom factor = old_spacing / new_spacing
     factors = (sx / tx, sy / ty, sz / tz)
 
-    # Nearest neighbor to preserve labels
-    out = zoom(mask, zoom=factors, order=0)
-    out = out.astype(mask.dtype, copy=False)
+    new_shape = tuple(max(int(round(n * f)), 1) for n, f in zip(mask.shape, factors))
+    if new_shape == mask.shape and factors == (1.0, 1.0, 1.0):
+        return mask, target_mm
+
+    # Nearest source index per output position along each axis, clamped to the input
+    ix, iy, iz = (
+        np.minimum(np.rint(np.arange(m) / f).astype(np.intp), n - 1)
+        for m, f, n in zip(new_shape, factors, mask.shape)
+    )
+    out = mask[np.ix_(ix, iy, iz)]
     return out, target_mm
@@ -1,51 +1,155 @@
 from __future__ import annotations
+from collections import OrderedDict
+import contextlib
+import hashlib
 import numpy as np
 
-def _build_adjacency_torch(faces_t, num_verts: int, device: str):
+# Recently built adjacencies, so e.g. a Laplacian and a Taubin pass over the same
+# faces only build the matrix once. Keyed on a digest of the face indices. Only
+# host-side CSR arrays are kept; device copies live for a single call.
+_ADJ_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_ADJ_CACHE_SIZE = 4
+
+def clear_adjacency_cache() -> None:
+    """Drop the adjacency arrays cached by smooth_vertices (e.g. between organs)."""
+    _ADJ_CACHE.clear()
+
+def _is_cpu(device: str) -> bool:
+    # Parsed by hand so the CPU path never has to import torch
+    return str(device).split(":", 1)[0] == "cpu"
+
+def _build_adjacency(faces: np.ndarray, num_verts: int):
     """
-    Build sparse adjacency matrix from triangle faces.
+    Build the CSR adjacency of a triangle mesh on the host.
 
     Args:
-        faces_t: Torch tensor of face indices (M, 3)
+        faces: Triangle face indices (M, 3) as numpy array
         num_verts: Total number of vertices
-        device: Torch device string
 
     Returns:
-        Tuple of (adjacency matrix, row sums) for Laplacian smoothing
+        Tuple of (row pointers, column indices, row sums) as numpy arrays
     """
-    import torch
+    n = int(num_verts)
+    m = len(faces)
 
     # Extract edges from triangular faces: (v0,v1), (v1,v2), (v0,v2)
-    edges = torch.cat([faces_t[:, :2], faces_t[:, 1:], faces_t[:, [0, 2]]], dim=0)
-    # Make undirected by adding reverse edges
-    edges = torch.cat([edges, edges[:, [1, 0]]], dim=0)
-    edges = torch.unique(edges, dim=0)
-
-    edge_weights = torch.ones(edges.shape[0], device=device)
+    edges = np.empty((3 * m, 2), dtype=faces.dtype)
+    edges[:m] = faces[:, [0, 1]]
+    edges[m:2 * m] = faces[:, [1, 2]]
+    edges[2 * m:] = faces[:, [0, 2]]
+    # Pack each undirected (min, max) pair into one int64 key, so the dedup is a
+    # 1-D sort instead of a row-wise unique
+    lo = np.minimum(edges[:, 0], edges[:, 1]).astype(np.int64)
+    key = lo * n + np.maximum(edges[:, 0], edges[:, 1])
+    key.sort()
+    keep = np.empty(len(key), dtype=bool)
+    keep[:1] = True
+    np.not_equal(key[1:], key[:-1], out=keep[1:])
+    key = key[keep]
+    a, b = np.divmod(key, n)
+    # Make undirected by adding reverse edges (self-loops only once), then sort
+    # by (row, col), which is exactly CSR order
+    key = np.concatenate([key, (b * n + a)[a != b]])
+    key.sort()
+    rows, cols = np.divmod(key, n)
 
-    # Build sparse adjacency matrix (edges are already bidirectional)
-    A = torch.sparse_coo_tensor(edges.t(), edge_weights, torch.Size([num_verts, num_verts]))
+    # crow holds cumulative edge counts (~6 per vertex), so both n and nnz must fit
+    index_dtype = np.int32 if max(n, len(key)) < np.iinfo(np.int32).max else np.int64
+    degree = np.bincount(rows, minlength=n)
+    crow = np.zeros(n + 1, dtype=index_dtype)
+    np.cumsum(degree, out=crow[1:])
+    cols = cols.astype(index_dtype)
     # Add small epsilon to prevent division by zero for isolated vertices
-    row_sum = torch.sparse.sum(A, dim=1).to_dense().clamp(min=1e-8)
-    return A, row_sum
+    row_sum = np.maximum(degree.astype(np.float32), 1e-8)
+    return crow, cols, row_sum
+
+def _cached_adjacency(faces: np.ndarray, num_verts: int, device: str):
+    """
+    Return (A, row_sum) for the faces, building the CSR arrays only on a cache miss.
+
+    Args:
+        faces: C-contiguous triangle face indices (M, 3)
+        num_verts: Total number of vertices
+        device: Torch device string
+
+    Returns:
+        Tuple of (adjacency matrix, row sums) for Laplacian smoothing. On CPU the
+        matrix is a scipy.sparse.csr_matrix and row sums a numpy array; on other
+        devices both are torch tensors (torch.sparse_csr_tensor), copied over
+        from the cached host arrays.
+    """
+    # Hashing the full index buffer is much cheaper than building the matrix, and
+    # unlike a partial sample it cannot confuse two meshes
+    digest = hashlib.blake2b(faces, digest_size=16).digest()
+    key = (faces.shape, faces.dtype.str, digest, int(num_verts))
+    hit = _ADJ_CACHE.get(key)
+    if hit is not None:
+        _ADJ_CACHE.move_to_end(key)
+    else:
+        hit = _build_adjacency(faces, num_verts)
+        _ADJ_CACHE[key] = hit
+        while len(_ADJ_CACHE) > _ADJ_CACHE_SIZE:
+            _ADJ_CACHE.popitem(last=False)
+
+    crow, cols, row_sum = hit
+    n = int(num_verts)
+    if _is_cpu(device):
+        from scipy import sparse
+        # Wraps the cached arrays without copying
+        A = sparse.csr_matrix((np.ones(len(cols), dtype=np.float32), cols, crow), shape=(n, n))
+        return A, row_sum
+
+    import torch
+    A = torch.sparse_csr_tensor(
+        torch.from_numpy(crow).to(device),
+        torch.from_numpy(cols).to(device),
+        torch.ones(len(cols), dtype=torch.float32, device=device),
+        size=(n, n),
+    )
+    return A, torch.from_numpy(row_sum).to(device)
 
-def _laplacian_step_torch(v, A, row_sum):
+def _laplacian_step(v, A, row_sum):
     """
     Compute one Laplacian smoothing step: L(v) = mean(neighbors) - v.
 
     Args:
-        v: Vertex positions (N, 3)
-        A: Sparse adjacency matrix
+        v: Vertex positions (N, 3) or one coordinate (N,), numpy array or torch tensor matching A
+        A: Sparse CSR adjacency matrix (scipy or torch)
         row_sum: Row sums of adjacency matrix for normalization
 
     Returns:
         Laplacian displacement vectors
     """
-    import torch
-    mean = torch.sparse.mm(A, v)
-    mean = mean / row_sum.unsqueeze(-1)
+    mean = A @ v
+    mean = mean / (row_sum if v.ndim == 1 else row_sum[:, None])
     return mean - v
 
+def _smooth_fused_cuda(v, A, coefs, num_iter: int, center=None) -> bool:
+    """
+    Smooth an fp32 CUDA tensor in place with the fused Numba kernel.
+
+    Args:
+        center: If given, gather neighbor positions from an fp16 copy taken
+                relative to this (3,) point (see _kernels_cuda.smooth_csr_)
+
+    Returns:
+        False if Numba CUDA is unavailable (nothing was done)
+    """
+    try:
+        from . import _kernels_cuda
+    except ImportError:
+        return False
+    if not _kernels_cuda.is_available():
+        return False
+
+    import torch
+    # Numba launches on its own stream; make sure the inputs are ready
+    torch.cuda.synchronize(v.device)
+    with _kernels_cuda.cuda.gpus[v.device.index or 0]:
+        crow, col, dv = (_kernels_cuda.cuda.as_cuda_array(a) for a in (A.crow_indices(), A.col_indices(), v))
+        _kernels_cuda.smooth_csr_(crow, col, dv, coefs, num_iter, half=center is not None, center=center)
+    return True
+
 def smooth_vertices(
     verts: np.ndarray,
     faces: np.ndarray,
@@ -55,9 +159,10 @@ def smooth_vertices(
     lambda_: float = 0.5,     # taubin
     mu: float = -0.53,        # taubin
     device: str = "cuda:0",
+    precision: str = "fp32",
 ) -> np.ndarray:
     """
-    Apply mesh smoothing to vertices using PyTorch.
+    Apply mesh smoothing to vertices (Numba or SciPy CSR on CPU, PyTorch CSR on GPU).
 
     Args:
         verts: Vertex positions (N, 3) as numpy array
@@ -68,6 +173,9 @@ def smooth_vertices(
         lambda_: Shrinkage factor for Taubin method
         mu: Inflation factor for Taubin method (typically negative)
         device: PyTorch device string (e.g., "cpu", "cuda:0")
+        precision: "fp16" gathers neighbor positions from a mesh-centered fp16
+            copy in the fused CUDA kernel; positions and means stay fp32. Ignored
+            on CPU and by the PyTorch fallback, which always run in fp32.
 
     Returns:
         Smoothed vertex positions (N, 3) as numpy float32 array
@@ -78,40 +186,75 @@ def smooth_vertices(
       - "none": returns verts unchanged
 
     Note:
-        Requires PyTorch. Install with `pip install torch` or `pip install 'xcat-mesh[gpu]'`
+        GPU devices require PyTorch. Install with `pip install 'xcat-mesh[gpu]'`.
+        On "cpu" only NumPy/SciPy (and optionally Numba) are used.
     """
     method = (method or "laplacian").lower()
-    if method in {"none", "off", "disable", "disabled"} or num_iter <= 0:
+    if (
+        method in {"none", "off", "disable", "disabled"}
+        or num_iter <= 0
+        or (method == "laplacian" and weight == 0)
+    ):
         return verts.astype(np.float32, copy=False)
 
-    try:
-        import torch
-    except Exception as e:
-        raise ImportError(
-            "Smoothing requires PyTorch in the current implementation. "
-            "Install with `pip install torch` (CPU) or `pip install 'xcat-mesh[gpu]'` (GPU)."
-        ) from e
-
-    # Ensure contiguous arrays (marching cubes may return negative strides)
-    verts_contig = np.ascontiguousarray(verts)
+    if method == "laplacian":
+        coefs = (float(weight),)
+    elif method == "taubin":
+        coefs = (float(lambda_), float(mu))
+    else:
+        raise ValueError(f"Unknown smoothing method: {method}")
+
+    cpu = _is_cpu(device)
+    if not cpu:
+        try:
+            import torch
+        except Exception as e:
+            raise ImportError(
+                "GPU smoothing requires PyTorch. Install with `pip install 'xcat-mesh[gpu]'`, "
+                "or set smooth.device to \"cpu\"."
+            ) from e
+
+    # Ensure contiguous arrays (marching cubes may return negative strides); float32
+    # contiguous input, as produced by marching_cubes_binary, passes through as is
+    verts_contig = np.ascontiguousarray(verts, dtype=np.float32)
     faces_contig = np.ascontiguousarray(faces)
 
-    v = torch.tensor(verts_contig, device=device, dtype=torch.float32)
-    f = torch.tensor(faces_contig, device=device, dtype=torch.int64)
-
-    A, row_sum = _build_adjacency_torch(f, v.shape[0], device=device)
-
-    for _ in range(int(num_iter)):
-        with torch.no_grad():
-            if method == "laplacian":
-                dv = _laplacian_step_torch(v, A, row_sum)
-                v += float(weight) * dv
-            elif method == "taubin":
-                dv = _laplacian_step_torch(v, A, row_sum)
-                v += float(lambda_) * dv
-                dv2 = _laplacian_step_torch(v, A, row_sum)
-                v += float(mu) * dv2
-            else:
-                raise ValueError(f"Unknown smoothing method: {method}")
-
-    return v.cpu().numpy().astype(np.float32, copy=False)
+    A, row_sum = _cached_adjacency(faces_contig, verts_contig.shape[0], device)
+
+    if cpu:
+        try:
+            from ._kernels import smooth_csr
+        except ImportError:
+            smooth_csr = None
+        if smooth_csr is not None:
+            # Parallel Numba loop straight over the scipy CSR arrays
+            return smooth_csr(verts_contig, A.indptr, A.indices, coefs, num_iter)
+        # scipy CSR spmv on plain numpy arrays
+        v = verts_contig
+    else:
+        # from_numpy is zero-copy, and .to() on another device copies exactly once
+        v = torch.from_numpy(verts_contig).to(device=device)
+
+    # On GPU, fuse each spmv + update into a single kernel when Numba CUDA is available
+    if not cpu:
+        center = None
+        if precision == "fp16" and len(verts_contig):
+            # Bounding box center from the host copy we already have
+            center = (verts_contig.min(axis=0) + verts_contig.max(axis=0)) * 0.5
+        if _smooth_fused_cuda(v, A, coefs, num_iter, center=center):
+            return v.cpu().numpy()
+
+    # Structure-of-arrays: one contiguous (N,) vector per coordinate, so each step is
+    # three stride-1 spmvs sharing the same CSR pattern instead of an (N, 3) spmm
+    # (this is also the copy that keeps the caller's vertices untouched on CPU)
+    comps = v.T.copy() if isinstance(v, np.ndarray) else v.t().contiguous()
+
+    with contextlib.nullcontext() if cpu else torch.no_grad():
+        for _ in range(int(num_iter)):
+            for coef in coefs:
+                for c in comps:
+                    c += coef * _laplacian_step(c, A, row_sum)
+
+    if isinstance(comps, np.ndarray):
+        return np.ascontiguousarray(comps.T)
+    return comps.t().contiguous().cpu().numpy()
@@ -26,7 +26,16 @@ def assert_non_empty(mask: np.ndarray) -> None:
         mask: Input mask array to validate
 
     Raises:
-        EmptyMaskError: If mask has no voxels with value 1
+        EmptyMaskError: If mask has no nonzero voxels
+
+    Note:
+        Expects an already binarized {0,1} mask; any nonzero voxel counts.
     """
-    if not np.any(mask == 1):
-        raise EmptyMaskError("Mask contains no foreground voxels (no value==1).")
+    if mask.flags.c_contiguous and mask.dtype.itemsize == 1 and mask.size % 8 == 0:
+        # Test 8 byte voxels per comparison; reshape is a view for C-contiguous input
+        found = mask.reshape(-1).view(np.uint64).any()
+    else:
+        # e.g. flipped views from reorientation: reshape would copy the volume
+        found = mask.any()
+    if not found:
+        raise EmptyMaskError("Mask contains no foreground voxels (all values are zero).")
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+_SRC = Path(__file__).parent.parent / "src"
+
+def _triangles(verts, faces, spacing):
+    # Order-independent triangle set on the half-voxel lattice; rotate each triangle
+    # to start at its smallest vertex so winding is still compared
+    out = set()
+    for tri in np.rint(verts[faces] / np.asarray(spacing) * 2).astype(int):
+        tri = [tuple(p) for p in tri]
+        i = tri.index(min(tri))
+        out.add(tuple(tri[i:] + tri[:i]))
+    return out
+
+def _grid_mesh(n=6, seed=0):
+    # Triangulated n x n height field with jittered vertices
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:n, 0:n]
+    verts = np.stack([x.ravel(), y.ravel(), rng.random(n * n)], axis=1).astype(np.float32)
+    idx = np.arange(n * n).reshape(n, n)
+    a, b, c, d = idx[:-1, :-1].ravel(), idx[:-1, 1:].ravel(), idx[1:, :-1].ravel(), idx[1:, 1:].ravel()
+    faces = np.concatenate([np.stack([a, b, c], 1), np.stack([b, d, c], 1)]).astype(np.int32)
+    return verts, faces
+
+def _run_python(code, *args, **env):
+    # Fresh interpreter with src/ importable, for process-wide patches and the
+    # CUDA simulator; returns stdout. Pass data through files, not test imports.
+    env = dict(os.environ, **env)
+    env["PYTHONPATH"] = os.pathsep.join([str(_SRC), env.get("PYTHONPATH", "")])
+    return subprocess.run([sys.executable, "-c", code, *map(str, args)], env=env, check=True,
+                          capture_output=True, text=True).stdout
+
+@pytest.fixture
+def triangles():
+    return _triangles
+
+@pytest.fixture
+def grid_mesh():
+    return _grid_mesh
+
+@pytest.fixture
+def run_python():
+    return _run_python
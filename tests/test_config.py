@@ -18,3 +18,17 @@ def test_config_requires_output():
             assert False, "expected ConfigError"
         except ConfigError:
             pass
+
+def test_config_rejects_unknown_marching_cubes():
+    cfg = {
+        "marching_cubes": "octree",
+        "output": {"mesh_unsmoothed_path": "mesh.obj"}
+    }
+    with tempfile.NamedTemporaryFile("w+", suffix=".json") as f:
+        json.dump(cfg, f)
+        f.flush()
+        try:
+            load_config(f.name)
+            assert False, "expected ConfigError"
+        except ConfigError:
+            pass
@@ -0,0 +1,74 @@
+import gzip
+import numpy as np
+import nibabel as nib
+from xcat_mesh.io import load_nifti_mask, save_obj
+
+def test_load_reorients_like_as_closest_canonical(tmp_path):
+    rng = np.random.default_rng(0)
+    data = (rng.random((6, 7, 8)) > 0.5).astype(np.uint8)
+    # Permuted, flipped axes with anisotropic voxels
+    affine = np.array([
+        [0.0, 0.0, -2.0, 10.0],
+        [0.8, 0.0, 0.0, -5.0],
+        [0.0, -1.5, 0.0, 3.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ])
+    img = nib.Nifti1Image(data, affine)
+    path = tmp_path / "mask.nii.gz"
+    nib.save(img, path)
+
+    mask, spacing = load_nifti_mask(path, reorient_canonical=True)
+    ref = nib.as_closest_canonical(img)
+    assert mask.dtype == np.uint8
+    np.testing.assert_array_equal(mask, np.asanyarray(ref.dataobj))
+    np.testing.assert_allclose(spacing, ref.header.get_zooms()[:3])
+
+    mask, spacing = load_nifti_mask(path, reorient_canonical=False)
+    np.testing.assert_array_equal(mask, data)
+    np.testing.assert_allclose(spacing, (0.8, 1.5, 2.0))
+
+def test_save_obj_format(tmp_path):
+    verts = np.array([[0.0, 1.5, 2.25], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]], dtype=np.float32)
+    faces = np.array([[0, 1, 2]], dtype=np.int32)
+    path = tmp_path / "mesh.obj"
+    save_obj(path, verts, faces)
+    assert path.read_text() == (
+        "v 0.000000 1.500000 2.250000\n"
+        "v 1.000000 0.000000 0.000000\n"
+        "v 0.000000 0.000000 1.000000\n"
+        "f 1 2 3\n"
+    )
+    save_obj(path, verts, faces, float_precision=2)
+    assert path.read_text().splitlines()[0] == "v 0.00 1.50 2.25"
+
+def test_save_obj_gzip(tmp_path):
+    verts = np.random.default_rng(0).random((70000, 3)).astype(np.float32)
+    faces = np.arange(69999 * 3).reshape(-1, 3) % 70000
+    plain = tmp_path / "mesh.obj"
+    packed = tmp_path / "mesh.obj.gz"
+    save_obj(plain, verts, faces)
+    save_obj(packed, verts, faces)
+    assert gzip.decompress(packed.read_bytes()) == plain.read_bytes()
+
+def test_fast_gzip_roundtrip(tmp_path, run_python):
+    # enable_fast_gzip patches the stdlib process-wide, so exercise it in a fresh
+    # interpreter rather than in the test process
+    import hashlib
+    data = np.random.default_rng(0).integers(0, 1000, (128, 128, 96), dtype=np.int16)
+    path = tmp_path / "big.nii.gz"
+    nib.save(nib.Nifti1Image(data, np.eye(4)), path)
+    assert path.stat().st_size > 2 << 20
+
+    code = (
+        "import gzip, hashlib, sys\n"
+        "from xcat_mesh import io\n"
+        "data, spacing = io.load_nifti_data(sys.argv[1], reorient_canonical=False, fast_gzip=True)\n"
+        "print(io.HAVE_INDEXED_GZIP or io._fast_gzip_enabled)\n"
+        "print(data.dtype, data.shape, hashlib.sha1(data.tobytes()).hexdigest())\n"
+        "print(gzip.decompress(gzip.compress(b'x' * 100000)) == b'x' * 100000)\n"
+    )
+    assert run_python(code, path).splitlines() == [
+        "True",
+        f"int16 (128, 128, 96) {hashlib.sha1(data.tobytes()).hexdigest()}",
+        "True",
+    ]
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from xcat_mesh.mesh import marching_cubes_binary, marching_cubes_sparse, _skimage_marching_cubes
+
+def _random_mask(shape, seed=0):
+    rng = np.random.default_rng(seed)
+    m = np.zeros(shape, dtype=np.uint8)
+    m[2:-3, 3:-2, 2:-4] = rng.random((shape[0] - 5, shape[1] - 5, shape[2] - 6)) > 0.4
+    m[0, :, :] = 1  # foreground touching the volume border
+    return m
+
+def _blob_mask(shape, seed=0):
+    # Ellipsoid plus a noisy patch and a border-touching slab: mostly uniform
+    # blocks, so the sparse pyramid has something to prune
+    n0, n1, n2 = shape
+    x, y, z = np.ogrid[:n0, :n1, :n2]
+    m = (((x - 0.45 * n0) / (0.3 * n0)) ** 2 + ((y - 0.45 * n1) / (0.3 * n1)) ** 2
+         + ((z - 0.5 * n2) / (0.3 * n2)) ** 2 < 1).astype(np.uint8)
+    rng = np.random.default_rng(seed)
+    m[-30:-10, -30:-10, -30:-10] = rng.random((20, 20, 20)) > 0.5
+    m[0, n1 // 3:n1 // 2, n2 // 8:n2 // 3] = 1
+    return m
+
+def test_sparse_matches_dense(triangles):
+    # max(shape) // 8 == 18, so blocks start at 16 = 4 * leaf_size and the
+    # coarse-to-fine refinement runs two levels
+    m = _blob_mask((150, 130, 97))
+    spacing = (0.7, 1.2, 2.0)
+    v0, f0 = marching_cubes_binary(m, spacing)
+    v1, f1 = marching_cubes_sparse(m, spacing, leaf_size=4)
+    assert v1.dtype == np.float32 and f1.dtype == np.int32
+    assert len(v1) == len(v0)
+    assert triangles(v0, f0, spacing) == triangles(v1, f1, spacing)
+
+def test_numba_matches_skimage(triangles):
+    pytest.importorskip("numba")
+    m = _random_mask((41, 36, 30), seed=1)
+    spacing = (0.7, 1.2, 2.0)
+    v0, f0 = _skimage_marching_cubes(m, spacing)
+    v1, f1 = marching_cubes_binary(m, spacing)
+    assert v1.dtype == np.float32 and f1.dtype == np.int32
+    assert len(v1) == len(v0)
+    assert triangles(v0, f0, spacing) == triangles(v1, f1, spacing)
+
+def test_sparse_empty():
+    v, f = marching_cubes_sparse(np.zeros((8, 8, 8), dtype=np.uint8), (1.0, 1.0, 1.0))
+    assert v.shape == (0, 3) and f.shape == (0, 3)
+
+_CUDASIM_MC = """
+import sys
+import numpy as np
+from xcat_mesh import _kernels_cuda
+from xcat_mesh.mesh import marching_cubes_binary
+
+assert _kernels_cuda.is_available()  # otherwise marching_cubes_binary falls back to the CPU
+d = np.load(sys.argv[1])
+verts, faces = marching_cubes_binary(d["mask"], tuple(d["spacing"]), device="cuda:0")
+np.savez(sys.argv[2], verts=verts, faces=faces)
+"""
+
+def test_cuda_matches_skimage(tmp_path, triangles, run_python):
+    # Numba's CUDA simulator in a subprocess, since it must be selected before
+    # numba.cuda is first imported
+    pytest.importorskip("numba")
+    m = _random_mask((14, 12, 11), seed=2)
+    spacing = (0.7, 1.2, 2.0)
+    np.savez(tmp_path / "in.npz", mask=m, spacing=spacing)
+    run_python(_CUDASIM_MC, tmp_path / "in.npz", tmp_path / "out.npz", NUMBA_ENABLE_CUDASIM="1")
+    out = np.load(tmp_path / "out.npz")
+    v0, f0 = _skimage_marching_cubes(m, spacing)
+    assert out["verts"].dtype == np.float32 and out["faces"].dtype == np.int32
+    assert len(out["verts"]) == len(v0)
+    assert triangles(v0, f0, spacing) == triangles(out["verts"], out["faces"], spacing)
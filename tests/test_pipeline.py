@@ -0,0 +1,62 @@
+import sys
+import numpy as np
+import nibabel as nib
+import pytest
+from xcat_mesh.config import MeshConfig, OutputConfig, SmoothConfig
+from xcat_mesh.errors import EmptyMaskError
+from xcat_mesh.mesh import marching_cubes_binary
+from xcat_mesh.pipeline import mesh_from_nifti, _prepare_mask
+
+@pytest.mark.parametrize("marching_cubes", ["dense", "sparse"])
+def test_cropped_mesh_matches_uncropped(tmp_path, marching_cubes, triangles):
+    rng = np.random.default_rng(0)
+    m = np.zeros((30, 26, 22), dtype=np.uint8)
+    # Off-origin blob (nonzero crop origin on every axis) ...
+    m[9:17, 11:20, 6:15] = rng.random((8, 9, 9)) > 0.3
+    # ... and foreground on the last x face, so the halo clamps at n
+    m[-1, 12:15, 8:10] = 1
+    spacing = (0.8, 1.5, 2.0)
+    path = tmp_path / "mask.nii.gz"
+    nib.save(nib.Nifti1Image(m, np.diag(spacing + (1.0,))), path)
+
+    cfg = MeshConfig(
+        target_resolution_mm=None,
+        reorient_canonical=False,
+        marching_cubes=marching_cubes,
+        smooth=SmoothConfig(enabled=False),
+        output=OutputConfig(mesh_unsmoothed_path="unused.obj"),
+    )
+    verts, faces, smoothed = mesh_from_nifti(path, cfg)
+    assert smoothed is None and verts.dtype == np.float32
+    v0, f0 = marching_cubes_binary(m, spacing)
+    assert triangles(verts, faces, spacing) == triangles(v0, f0, spacing)
+
+    # Foreground on the first x face instead: halo clamps at 0, origin stays 0 on x
+    m[-1] = 0
+    m[0, 3:6, 2:5] = 1
+    nib.save(nib.Nifti1Image(m, np.diag(spacing + (1.0,))), path)
+    verts, faces, _ = mesh_from_nifti(path, cfg)
+    v0, f0 = marching_cubes_binary(m, spacing)
+    assert triangles(verts, faces, spacing) == triangles(v0, f0, spacing)
+
+def test_prepare_mask_numba_matches_numpy(monkeypatch):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(1)
+    vol = rng.random((9, 10, 11))
+    inputs = [
+        vol,                                            # float in [0, 1)
+        (vol * 3).astype(np.int16),                     # integer labels
+        (vol > 0.5).astype(np.float32)[::-1, :, ::-2],  # flipped, strided view
+    ]
+    fast = [_prepare_mask(x) for x in inputs]
+    with pytest.raises(EmptyMaskError):
+        _prepare_mask(np.zeros((4, 4, 4), dtype=np.float32))
+
+    monkeypatch.setitem(sys.modules, "xcat_mesh._kernels", None)
+    for x, a in zip(inputs, fast):
+        b = _prepare_mask(x)
+        assert a.dtype == b.dtype == np.uint8
+        np.testing.assert_array_equal(a, b)
+        np.testing.assert_array_equal(b, x > 0.5)
+    with pytest.raises(EmptyMaskError):
+        _prepare_mask(np.zeros((4, 4, 4), dtype=np.float32))
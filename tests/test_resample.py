@@ -0,0 +1,48 @@
+import numpy as np
+from xcat_mesh.resample import resample_to_target_resolution
+
+def _coords(shape):
+    # Each voxel holds its own flat index, so the gather can be read back
+    return np.arange(np.prod(shape), dtype=np.int32).reshape(shape)
+
+def test_shapes_and_dtype():
+    m = np.zeros((4, 5, 6), dtype=np.uint8)
+    up, spacing = resample_to_target_resolution(m, (2.0, 2.0, 2.0), (1.0, 1.0, 1.0))
+    assert up.shape == (8, 10, 12) and up.dtype == np.uint8
+    assert spacing == (1.0, 1.0, 1.0)
+
+    down, _ = resample_to_target_resolution(m.astype(np.int16), (1.0, 1.0, 1.0), (2.0, 2.5, 4.0))
+    assert down.shape == (2, 2, 2) and down.dtype == np.int16
+
+def test_nearest_mapping():
+    src = _coords((3, 2, 4))
+    out, _ = resample_to_target_resolution(src, (1.0, 1.0, 1.0), (0.4, 1.0, 2.0))
+    # x upsampled by 2.5: output i sits at i * 0.4 mm, nearest source rint(i * 0.4)
+    # (the last one clamped); y unchanged; z halved (every other slice)
+    np.testing.assert_array_equal(out, src[[0, 0, 1, 1, 2, 2, 2, 2]][:, :, [0, 2]])
+
+def test_three_to_one_mm_slices():
+    src = np.arange(4, dtype=np.int32).reshape(1, 1, 4)
+    out, _ = resample_to_target_resolution(src, (1.0, 1.0, 3.0), (1.0, 1.0, 1.0))
+    # 1 mm slices at 0..11 mm take the nearest 3 mm slice at 0, 3, 6, 9 mm
+    np.testing.assert_array_equal(out[0, 0], [0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3])
+
+def test_indices_clamped_to_input():
+    # Sweep non-integer factors; every output index must map inside the input
+    clamped = 0
+    for n in (1, 7, 10, 33):
+        src = np.arange(n, dtype=np.int32).reshape(n, 1, 1)
+        for t in np.linspace(0.1, 3.0, 30):
+            out, _ = resample_to_target_resolution(src, (1.0, 1.0, 1.0), (t, 1.0, 1.0))
+            f = 1.0 / t
+            nearest = np.rint(np.arange(out.shape[0]) / f).astype(int)
+            clamped += int(nearest[-1] > n - 1)
+            np.testing.assert_array_equal(out[:, 0, 0], np.minimum(nearest, n - 1))
+            assert out.shape[0] == max(int(round(n * f)), 1)
+    assert clamped  # the sweep does reach the clamp
+
+def test_unit_factor_returns_input():
+    m = _coords((3, 4, 5))
+    out, spacing = resample_to_target_resolution(m, (0.8, 1.5, 2.0), (0.8, 1.5, 2.0))
+    assert out is m
+    assert spacing == (0.8, 1.5, 2.0)
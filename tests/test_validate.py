@@ -20,3 +20,16 @@ def test_empty_raises():
     assert_binary_mask(m)
     with pytest.raises(EmptyMaskError):
         assert_non_empty(m)
+
+def test_non_empty_flipped_view_no_copy():
+    import tracemalloc
+    m = np.zeros((64, 64, 64), dtype=np.uint8)
+    m[40, 50, 60] = 1
+    view = m[::-1, :, ::-1]
+    tracemalloc.start()
+    assert_non_empty(view)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < m.nbytes // 8
+    with pytest.raises(EmptyMaskError):
+        assert_non_empty(np.zeros((8, 8, 8), dtype=np.uint8)[::-1])